@@ -1,24 +1,65 @@
-from flask import Flask, render_template, request, send_file, jsonify, flash, session, redirect, url_for
+from flask import Flask, render_template, request, send_file, jsonify, flash, session, redirect, url_for, make_response, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_login import LoginManager, login_required, current_user
+from markupsafe import Markup, escape
+from sqlalchemy.orm import make_transient_to_detached
 from core.simple_builder import generate_resume
 from core.simple_exporter import export_to_docx, export_to_pdf
 from config import Config
-from models import db, User, Resume
-from auth import auth_bp
+from models import db, User, Resume, ResumeDraft
+from extensions import cache
+from auth import auth_bp, user_cache_key, user_cache_values, USER_CACHE_TIMEOUT
 from dashboard import dashboard_bp
+from tasks import celery, build_export, build_export_task
 
 import os
+import re
+import json
+import hashlib
+import time
 import uuid
+import threading
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import BytesIO
 import tempfile
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Optional fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster jsonify() serialization"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent') is not None:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.config.from_object(Config)
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
 
 # Initialize extensions
 db.init_app(app)
+cache.init_app(app)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'auth.signin'
@@ -31,29 +72,142 @@ app.register_blueprint(dashboard_bp)
 
 @login_manager.user_loader
 def load_user(user_id):
-    # Handle UUID strings (from Supabase) - don't convert to int
-    return User.query.get(user_id)
+    # Handle UUID strings (from Supabase) - don't convert to int.
+    # Flask-Login caches the result on g for the rest of the request, so
+    # this runs at most once per request however often current_user is used.
+    if not app.config['USER_CACHE_ENABLED']:
+        return db.session.get(User, user_id)
+    
+    key = user_cache_key(user_id)
+    values = cache.get(key)
+    if values is not None:
+        # Rebuild the user from its cached column values and attach it to this
+        # request's session without a SELECT; every User update or delete drops
+        # the entry (auth._invalidate_cached_user)
+        user = User(**values)
+        make_transient_to_detached(user)
+        db.session.add(user)
+        return user
+    
+    user = db.session.get(User, user_id)
+    if user is not None:
+        cache.set(key, user_cache_values(user), timeout=USER_CACHE_TIMEOUT)
+    return user
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = app.config['OUTPUT_DIR']
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# Supported styles and formats
+# Supported styles and formats (immutable; checked on every request)
 SUPPORTED_STYLES = app.config['SUPPORTED_STYLES']
 SUPPORTED_FORMATS = app.config['SUPPORTED_FORMATS']
 
-# Create database tables
-with app.app_context():
-    db.create_all()
+# Cache lifetime for static pages (seconds)
+STATIC_PAGE_MAX_AGE = 300
+
+# Background export task ids remembered per session (see /download_status)
+MAX_EXPORT_TASKS = 10
+
+# Cache lifetime for generated previews (seconds)
+PREVIEW_CACHE_TIMEOUT = 600
+
+# Resume-to-HTML line classification
+SECTION_HEADERS = frozenset({
+    'CONTACT INFORMATION', 'PROFESSIONAL SUMMARY', 'EDUCATION',
+    'WORK EXPERIENCE', 'PROJECTS', 'SKILLS', 'CERTIFICATIONS'
+})
+SEPARATOR_RE = re.compile(r'^(?:---|===|___)')
+BULLET_RE = re.compile(r'^[•\-▸]')
+NAME_EXCLUDE_RE = re.compile(r'[@()]|http')
+CONTACT_SECTIONS = frozenset({'CONTACT INFORMATION', 'CONTACT'})
+ENTRY_SECTIONS = frozenset({'EDUCATION', 'WORK EXPERIENCE', 'EXPERIENCE'})
+
+# Resume-to-HTML element templates
+NAME_HTML = '<div class="resume-header">\n<h1 class="resume-name">%s</h1>\n</div>'.__mod__
+SECTION_HTML = '<div class="resume-section">\n<h2 class="resume-section-title">%s</h2>'.__mod__
+BULLET_HTML = '<div class="resume-bullet">%s</div>'.__mod__
+CONTACT_HTML = '<div class="resume-contact">%s</div>'.__mod__
+ITEM_HEADER_HTML = '<div class="resume-item-header">%s</div>'.__mod__
+ITEM_CONTENT_HTML = '<div class="resume-item-content">%s</div>'.__mod__
+ITEM_SUBHEADER_HTML = '<div class="resume-item-subheader">%s</div>'.__mod__
+
+# Single-value wizard form fields
+TOP_LEVEL_FIELDS = ("name", "email", "phone", "location", "linkedin", "website", "objective", "skills")
+REQUIRED_FIELDS = ("name", "email", "phone")
+
+# Indexed wizard form fields, e.g. "experience_title_2"
+ENTRY_FIELDS = {
+    'education': ("institution", "degree", "field", "start", "end", "gpa", "achievements"),
+    'experience': ("company", "title", "start", "end", "responsibilities", "achievements"),
+    'project': ("name", "description", "technologies", "link"),
+    'custom': ("title", "content"),
+}
+ENTRY_KEY_RE = re.compile(r'^(education|experience|project|custom)_([a-z]+)_([1-9]\d*)$')
+
+def init_db():
+    """Create any missing database tables"""
+    with app.app_context():
+        db.create_all()
+
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create database tables (run once per deploy)"""
+    init_db()
+    print("✅ Database tables created")
+
+
+# Schema creation is a deploy step; only run it at import when asked to
+if app.config['AUTO_CREATE_DB']:
+    init_db()
+
+
+def load_resume_draft():
+    """Load the in-progress resume referenced by the session cookie"""
+    draft_id = session.get('resume_draft_id')
+    if not draft_id:
+        return None
+    return db.session.get(ResumeDraft, draft_id)
+
+
+def store_resume_draft(resume_text=None, style=None, form_data=None):
+    """Create or update the server-side resume draft and keep only its id in the session"""
+    draft = load_resume_draft()
+    if draft is None:
+        draft = ResumeDraft(form_data='{}')
+        db.session.add(draft)
+
+    if resume_text is not None:
+        draft.content = resume_text
+    if style is not None:
+        draft.style = style
+    if form_data is not None:
+        draft.set_form_data(form_data)
+
+    db.session.commit()
+    session['resume_draft_id'] = draft.id
+    return draft
+
+
+def cacheable(response, max_age=STATIC_PAGE_MAX_AGE):
+    """Mark a response as cacheable by browsers and shared caches"""
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+
+def revalidated(response):
+    """Let only the browser keep a copy, and have it check back via ETag before each reuse"""
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @app.route("/")
 def landing():
     """Landing page"""
-    return render_template("landing.html")
+    return cacheable(make_response(render_template("landing.html")))
 
 
 @app.route("/form", methods=["GET", "POST"])
@@ -64,19 +218,21 @@ def home():
         # The new wizard uses JavaScript to redirect to loading page
         return render_template("index.html")
     
-    return render_template("index.html")
+    # The page can carry flashed messages, so a stored copy is only reused
+    # while its ETag still matches what the server renders now
+    return revalidated(make_response(render_template("index.html")))
 
 
 @app.route("/review")
 def review():
     """Show resume review page"""
-    if 'resume_data' not in session:
+    draft = load_resume_draft()
+    if draft is None:
         flash("No resume data found. Please generate a resume first.", "error")
         return redirect(url_for('home'))
     
-    resume_data = session['resume_data']
-    resume_text = resume_data['resume_text']
-    style = resume_data['style']
+    resume_text = draft.content
+    style = draft.style
     
     # Convert resume text to HTML for display
     resume_html = convert_resume_to_html(resume_text, style)
@@ -103,10 +259,12 @@ def update_resume():
         if not resume_text.strip():
             return jsonify({'success': False, 'error': 'Resume text cannot be empty'})
         
-        # Update session data
-        if 'resume_data' in session:
-            session['resume_data']['resume_text'] = resume_text
-            session['resume_data']['style'] = style
+        # Update stored draft
+        draft = load_resume_draft()
+        if draft is not None:
+            draft.content = resume_text
+            draft.style = style
+            db.session.commit()
         
         # Convert to HTML for display
         resume_html = convert_resume_to_html(resume_text, style)
@@ -132,9 +290,11 @@ def change_style():
         if style not in SUPPORTED_STYLES:
             style = 'modern'
         
-        # Update session data
-        if 'resume_data' in session:
-            session['resume_data']['style'] = style
+        # Update stored draft
+        draft = load_resume_draft()
+        if draft is not None:
+            draft.style = style
+            db.session.commit()
         
         # Convert to HTML with new style
         resume_html = convert_resume_to_html(resume_text, style)
@@ -161,27 +321,36 @@ def download_resume():
         if not resume_text.strip():
             return jsonify({'success': False, 'error': 'Resume text cannot be empty'})
         
-        # Create temporary file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"resume_{style}_{timestamp}.{format_type}"
-        filepath = os.path.join(OUTPUT_DIR, filename)
-        
-        # Export to selected format
         if format_type == "pdf":
-            export_to_pdf(resume_text, filepath)
             mime_type = "application/pdf"
         else:
-            export_to_docx(resume_text, filepath)
             mime_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         
         # Get clean name for download
-        form_data = session.get('resume_data', {}).get('form_data', {})
+        draft = load_resume_draft()
+        form_data = draft.get_form_data() if draft else {}
         name = form_data.get('name', 'Resume')
         clean_name = name.replace(' ', '_').replace('.', '')
         download_name = f"{clean_name}_Resume.{format_type}"
         
+        # Hand the export to a background worker when one is configured;
+        # the client polls /download_status/<task_id> for the file
+        if build_export_task:
+            # Unique per export so concurrent downloads never share a file
+            filename = f"resume_{style}_{uuid.uuid4().hex}.{format_type}"
+            filepath = os.path.join(OUTPUT_DIR, filename)
+            task = build_export_task.delay(resume_text, format_type, filepath, mime_type, download_name)
+            # Only this session may fetch the result
+            session['export_tasks'] = (session.get('export_tasks', []) + [task.id])[-MAX_EXPORT_TASKS:]
+            return jsonify({'success': True, 'task_id': task.id}), 202
+        
+        # Export to selected format in memory
+        buffer = BytesIO()
+        build_export(resume_text, format_type, buffer, mime_type, download_name)
+        buffer.seek(0)
+        
         return send_file(
-            filepath,
+            buffer,
             as_attachment=True,
             mimetype=mime_type,
             download_name=download_name
@@ -192,16 +361,48 @@ def download_resume():
         return jsonify({'success': False, 'error': str(e)})
 
 
+@app.route("/download_status/<task_id>")
+def download_status(task_id):
+    """Return the finished export for a background download task"""
+    if not celery:
+        return jsonify({'success': False, 'error': 'Background exports are not enabled'}), 404
+    
+    if task_id not in session.get('export_tasks', ()):
+        return jsonify({'success': False, 'error': 'Export not found'}), 404
+    
+    try:
+        result = celery.AsyncResult(task_id)
+        
+        if not result.ready():
+            return jsonify({'success': True, 'ready': False}), 202
+        
+        if result.failed():
+            logger.error(f"Export task {task_id} failed: {result.result}")
+            return jsonify({'success': False, 'error': 'Failed to export resume'}), 500
+        
+        export = result.result
+        return send_file(
+            export['filepath'],
+            as_attachment=True,
+            mimetype=export['mimetype'],
+            download_name=export['download_name']
+        )
+        
+    except Exception as e:
+        logger.error(f"Error checking download status: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route("/regenerate_resume", methods=["POST"])
 def regenerate_resume():
     """Regenerate resume using stored form data"""
     try:
-        if 'resume_data' not in session:
+        draft = load_resume_draft()
+        if draft is None:
             return jsonify({'success': False, 'error': 'No resume data found'})
         
-        resume_data = session['resume_data']
-        form_data = resume_data.get('form_data', {})
-        style = resume_data.get('style', 'modern')
+        form_data = draft.get_form_data()
+        style = draft.style or 'modern'
         
         # Regenerate resume
         new_resume_text = generate_resume(form_data, style)
@@ -209,8 +410,8 @@ def regenerate_resume():
         if not new_resume_text or not new_resume_text.strip():
             return jsonify({'success': False, 'error': 'Failed to regenerate resume'})
         
-        # Update session
-        session['resume_data']['resume_text'] = new_resume_text
+        # Update stored draft
+        store_resume_draft(resume_text=new_resume_text)
         
         return jsonify({'success': True})
         
@@ -224,11 +425,11 @@ def regenerate_resume():
 def save_resume():
     """Save current resume from session to database"""
     try:
-        # Get resume data from session
-        if 'resume_data' not in session:
+        # Get resume data from the stored draft
+        draft = load_resume_draft()
+        if draft is None:
             return jsonify({'success': False, 'error': 'No resume data found'})
         
-        resume_data = session['resume_data']
         title = request.json.get('title', '').strip()
         
         if not title:
@@ -243,9 +444,9 @@ def save_resume():
             if not resume:
                 return jsonify({'success': False, 'error': 'Resume not found'})
             
-            resume.content = resume_data['resume_text']
-            resume.style = resume_data['style']
-            resume.set_form_data(resume_data['form_data'])
+            resume.content = draft.content
+            resume.style = draft.style
+            resume.form_data = draft.form_data
             resume.updated_at = datetime.utcnow()
             
             # Clear editing session
@@ -268,10 +469,10 @@ def save_resume():
             resume = Resume(
                 user_id=current_user.id,
                 title=title,
-                content=resume_data['resume_text'],
-                style=resume_data['style']
+                content=draft.content,
+                style=draft.style,
+                form_data=draft.form_data
             )
-            resume.set_form_data(resume_data['form_data'])
             
             db.session.add(resume)
             db.session.commit()
@@ -299,12 +500,12 @@ def edit_resume(resume_id):
             flash('Resume not found', 'error')
             return redirect(url_for('dashboard.dashboard'))
         
-        # Load resume data into session
-        session['resume_data'] = {
-            'resume_text': resume.content,
-            'style': resume.style,
-            'form_data': resume.get_form_data()
-        }
+        # Load resume data into the server-side draft
+        store_resume_draft(
+            resume_text=resume.content,
+            style=resume.style,
+            form_data=resume.get_form_data()
+        )
         
         # Store resume ID for updating
         session['editing_resume_id'] = resume_id
@@ -335,13 +536,10 @@ def download_resume_file(resume_id):
             flash('Resume not found', 'error')
             return redirect(url_for('dashboard.dashboard'))
         
-        # Create temporary file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"resume_{resume.style}_{timestamp}.docx"
-        filepath = os.path.join(OUTPUT_DIR, filename)
-        
-        # Export to DOCX
-        export_to_docx(resume.content, filepath)
+        # Export to DOCX in memory
+        buffer = BytesIO()
+        export_to_docx(resume.content, buffer)
+        buffer.seek(0)
         
         # Get clean name for download
         form_data = resume.get_form_data()
@@ -350,7 +548,7 @@ def download_resume_file(resume_id):
         download_name = f"{clean_name}_Resume.docx"
         
         return send_file(
-            filepath,
+            buffer,
             as_attachment=True,
             mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             download_name=download_name
@@ -413,19 +611,20 @@ def update_existing_resume(resume_id):
             resume.style = style
             resume.updated_at = datetime.utcnow()
             
-            # Also update session if it exists
-            if 'resume_data' in session:
-                session['resume_data']['resume_text'] = resume_text
-                session['resume_data']['style'] = style
+            # Also update the stored draft if it exists
+            draft = load_resume_draft()
+            if draft is not None:
+                draft.content = resume_text
+                draft.style = style
         else:
-            # Update from session (for review page compatibility)
-            if 'resume_data' not in session:
+            # Update from the stored draft (for review page compatibility)
+            draft = load_resume_draft()
+            if draft is None:
                 return jsonify({'success': False, 'error': 'No resume data found'})
             
-            resume_data = session['resume_data']
-            resume.content = resume_data['resume_text']
-            resume.style = resume_data['style']
-            resume.set_form_data(resume_data['form_data'])
+            resume.content = draft.content
+            resume.style = draft.style
+            resume.form_data = draft.form_data
             resume.updated_at = datetime.utcnow()
         
         db.session.commit()
@@ -441,6 +640,7 @@ def update_existing_resume(resume_id):
         return jsonify({'success': False, 'error': 'Failed to update resume'})
 
 
+@cache.memoize(timeout=600)
 def convert_resume_to_html(resume_text, style):
     """Convert plain text resume to HTML for display"""
     if not resume_text:
@@ -448,67 +648,53 @@ def convert_resume_to_html(resume_text, style):
     
     lines = resume_text.split('\n')
     html_parts = []
+    append = html_parts.append
     current_section = None
     
+    # Add name header if we can extract it
+    for line in lines[:5]:  # Check first 5 lines for name
+        line = line.strip()
+        if line and not line.isupper() and 5 < len(line) < 50:
+            if not NAME_EXCLUDE_RE.search(line):
+                append(NAME_HTML(escape(line)))
+                break
+    
     for line in lines:
         line = line.strip()
         if not line:
             continue
         
-        # Check if it's a section header (all caps or specific patterns)
-        if (line.isupper() and len(line) > 2 and len(line) < 50) or \
-           line in ['CONTACT INFORMATION', 'PROFESSIONAL SUMMARY', 'EDUCATION', 
-                   'WORK EXPERIENCE', 'PROJECTS', 'SKILLS', 'CERTIFICATIONS']:
-            current_section = line
-            html_parts.append(f'<div class="resume-section">')
-            html_parts.append(f'<h2 class="resume-section-title">{line}</h2>')
+        # Skip separator lines
+        if SEPARATOR_RE.match(line):
             continue
         
-        # Skip separator lines
-        if line.startswith('---') or line.startswith('===') or line.startswith('___'):
+        # User text is escaped once and reused by whichever element it lands in
+        safe_line = escape(line)
+        
+        # Check if it's a section header (all caps or specific patterns)
+        if (line.isupper() and 2 < len(line) < 50) or line in SECTION_HEADERS:
+            current_section = line
+            append(SECTION_HTML(safe_line))
             continue
         
         # Handle different content types
-        if line.startswith('•') or line.startswith('-') or line.startswith('▸'):
-            html_parts.append(f'<div class="resume-bullet">{line}</div>')
-        elif current_section == 'CONTACT INFORMATION' or current_section == 'CONTACT':
-            html_parts.append(f'<div class="resume-contact">{line}</div>')
-        elif '|' in line and current_section in ['EDUCATION', 'WORK EXPERIENCE', 'EXPERIENCE']:
+        if BULLET_RE.match(line):
+            append(BULLET_HTML(safe_line))
+        elif current_section in CONTACT_SECTIONS:
+            append(CONTACT_HTML(safe_line))
+        elif '|' in line and current_section in ENTRY_SECTIONS:
             # Handle formatted entries like "Job Title | Company | Date"
-            html_parts.append(f'<div class="resume-item-header">{line}</div>')
-        else:
-            # Regular content
-            if len(line) > 100:  # Longer text, probably description
-                html_parts.append(f'<div class="resume-item-content">{line}</div>')
-            else:  # Shorter text, probably header or subheader
-                html_parts.append(f'<div class="resume-item-subheader">{line}</div>')
+            append(ITEM_HEADER_HTML(safe_line))
+        elif len(line) > 100:  # Longer text, probably description
+            append(ITEM_CONTENT_HTML(safe_line))
+        else:  # Shorter text, probably header or subheader
+            append(ITEM_SUBHEADER_HTML(safe_line))
     
     # Close any open section
     if current_section:
         html_parts.append('</div>')
     
-    # Wrap in header if we have contact info
-    html_content = '\n'.join(html_parts)
-    
-    # Add name header if we can extract it
-    lines = resume_text.split('\n')
-    name_line = None
-    for line in lines[:5]:  # Check first 5 lines for name
-        line = line.strip()
-        if line and not line.isupper() and len(line) > 5 and len(line) < 50:
-            if not any(char in line for char in ['@', 'http', '(', ')']):
-                name_line = line
-                break
-    
-    if name_line:
-        html_content = f'''
-        <div class="resume-header">
-            <h1 class="resume-name">{name_line}</h1>
-        </div>
-        {html_content}
-        '''
-    
-    return html_content
+    return Markup('\n'.join(html_parts))
 
 
 @app.route("/loading")
@@ -522,56 +708,53 @@ def generate():
     """Generate resume and redirect to review page"""
     try:
         logger.info("Generate route called")
-        logger.info(f"Request method: {request.method}")
-        logger.info(f"Form data keys: {list(request.form.keys())}")
-        
-        # Fast data extraction using optimized function
-        data = extract_form_data_optimized(request.form)
-        
-        logger.info(f"Form data extracted: {len(data)} fields")
-        logger.info(f"Education entries: {len(data.get('education_entries', []))}")
-        logger.info(f"Experience entries: {len(data.get('experience_entries', []))}")
-        logger.info(f"Project entries: {len(data.get('project_entries', []))}")
+        form = request.form
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Form data keys: %s", list(form.keys()))
         
-        # Quick validation
-        if not all([data.get("name"), data.get("email"), data.get("phone")]):
+        # Quick validation before doing any extraction work
+        if not has_required_fields(form):
             logger.warning("Missing required fields")
             flash("Please fill in all required fields (Name, Email, Phone)", "error")
             return render_template("index.html")
         
+        # Fast data extraction using optimized function
+        data = extract_form_data_optimized(form)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Form data extracted: %d fields", len(data))
+            logger.debug("Education entries: %d", len(data.get('education_entries', [])))
+            logger.debug("Experience entries: %d", len(data.get('experience_entries', [])))
+            logger.debug("Project entries: %d", len(data.get('project_entries', [])))
+        
         # Get style with default
-        style = request.form.get("style", "modern").strip().lower()
+        style = form.get("style", "modern").strip().lower()
         if style not in SUPPORTED_STYLES:
             style = "modern"
 
-        logger.info(f"Generating resume with style: {style}")
+        logger.info("Generating resume with style: %s", style)
         
         # Generate resume text (this is the main processing step)
         resume_text = generate_resume(data, style)
         
-        logger.info(f"Generated resume length: {len(resume_text)} characters")
+        logger.info("Generated resume length: %d characters", len(resume_text))
         
         if not resume_text or not resume_text.strip():
             logger.error("Resume generation returned empty content")
             flash("Failed to generate resume content. Please try again.", "error")
             return render_template("index.html")
 
-        # Store in session for review page
-        session['resume_data'] = {
-            'resume_text': resume_text,
-            'style': style,
-            'form_data': data
-        }
+        # Store server-side for review page, keeping only the draft id in the session
+        store_resume_draft(resume_text=resume_text, style=style, form_data=data)
         
-        logger.info("Resume data stored in session, redirecting to review page")
+        logger.info("Resume draft stored, redirecting to review page")
         
         # Redirect to review page
         return redirect(url_for('review'))
 
     except Exception as e:
-        logger.error(f"Error generating resume: {str(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Error generating resume: %s", e)
+        logger.debug("Traceback:", exc_info=True)
         flash("An error occurred while generating your resume. Please try again.", "error")
         return render_template("index.html")
 
@@ -580,31 +763,41 @@ def generate():
 def preview_resume():
     """Generate a preview of the resume - Optimized for speed"""
     try:
+        form = request.form
+        if not has_required_fields(form):
+            return jsonify({
+                "success": False,
+                "error": "Fill in Name, Email and Phone to see a preview"
+            }), 400
+        
         # Fast data extraction
-        data = extract_form_data_optimized(request.form)
+        data = extract_form_data_optimized(form)
         
         # Debug logging
-        logger.info(f"Preview data received:")
-        logger.info(f"  - Name: {data.get('name')}")
-        logger.info(f"  - Education entries: {len(data.get('education_entries', []))}")
-        logger.info(f"  - Experience entries: {len(data.get('experience_entries', []))}")
-        logger.info(f"  - Project entries: {len(data.get('project_entries', []))}")
-        logger.info(f"  - Custom sections: {len(data.get('custom_sections', []))}")
-        
-        # Log first few form keys for debugging
-        form_keys = list(request.form.keys())[:20]
-        logger.info(f"First 20 form keys: {form_keys}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Preview data received:")
+            logger.debug("  - Name: %s", data.get('name'))
+            logger.debug("  - Education entries: %d", len(data.get('education_entries', [])))
+            logger.debug("  - Experience entries: %d", len(data.get('experience_entries', [])))
+            logger.debug("  - Project entries: %d", len(data.get('project_entries', [])))
+            logger.debug("  - Custom sections: %d", len(data.get('custom_sections', [])))
+            logger.debug("First 20 form keys: %s", list(form.keys())[:20])
         
         # Get style with default
-        style = request.form.get("style", "modern").strip().lower()
+        style = form.get("style", "modern").strip().lower()
         if style not in SUPPORTED_STYLES:
             style = "modern"
         
-        # Generate resume text (optimized for preview)
-        resume_text = generate_resume(data, style)
+        # Generate resume text (optimized for preview); identical submissions
+        # reuse the previously generated text
+        cache_key = preview_cache_key(data, style)
+        resume_text = cache.get(cache_key)
+        if resume_text is None:
+            resume_text = generate_resume(data, style)
+            cache.set(cache_key, resume_text, timeout=PREVIEW_CACHE_TIMEOUT)
         
-        logger.info(f"Generated resume length: {len(resume_text)} characters")
-        logger.info(f"Resume preview (first 500 chars): {resume_text[:500]}...")
+        logger.info("Generated resume length: %d characters", len(resume_text))
+        logger.debug("Resume preview (first 500 chars): %.500s...", resume_text)
         
         return jsonify({
             "success": True,
@@ -613,41 +806,39 @@ def preview_resume():
         })
         
     except Exception as e:
-        logger.error(f"Error generating preview: {str(e)}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.error("Error generating preview: %s", e)
+        logger.debug("Traceback:", exc_info=True)
         return jsonify({
             "success": False,
             "error": "Failed to generate preview"
         }), 500
 
 
+def has_required_fields(form_data):
+    """Check the required contact fields directly on the submitted form"""
+    return all(form_data.get(field, "").strip() for field in REQUIRED_FIELDS)
+
+
+def preview_cache_key(data, style):
+    """Stable cache key for a (form data, style) preview request"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps([data, style], option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps([data, style], sort_keys=True).encode('utf-8')
+    return 'preview:' + hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 def extract_form_data_optimized(form_data):
     """Optimized form data extraction for better performance"""
     # Basic data extraction
-    data = {
-        "name": form_data.get("name", "").strip(),
-        "email": form_data.get("email", "").strip(),
-        "phone": form_data.get("phone", "").strip(),
-        "location": form_data.get("location", "").strip(),
-        "linkedin": form_data.get("linkedin", "").strip(),
-        "website": form_data.get("website", "").strip(),
-        "objective": form_data.get("objective", "").strip(),
-        "skills": form_data.get("skills", "").strip(),
-    }
-    
-    # Extract structured entries efficiently
-    education_entries = extract_entries(form_data, "education", 
-        ["institution", "degree", "field", "start", "end", "gpa", "achievements"])
-    
-    experience_entries = extract_entries(form_data, "experience",
-        ["company", "title", "start", "end", "responsibilities", "achievements"])
-    
-    project_entries = extract_entries(form_data, "project",
-        ["name", "description", "technologies", "link"])
-    
-    custom_sections = extract_entries(form_data, "custom",
-        ["title", "content"])
+    data = {field: form_data.get(field, "").strip() for field in TOP_LEVEL_FIELDS}
+    
+    # Extract structured entries in a single pass over the form
+    entries = extract_entries(form_data)
+    education_entries = entries['education']
+    experience_entries = entries['experience']
+    project_entries = entries['project']
+    custom_sections = entries['custom']
     
     # Add to data
     data['education_entries'] = education_entries
@@ -663,27 +854,29 @@ def extract_form_data_optimized(form_data):
     return data
 
 
-def extract_entries(form_data, entry_type, fields):
-    """Generic function to extract structured entries efficiently"""
-    entries = []
-    i = 1
+def extract_entries(form_data):
+    """Extract structured entries for every entry type with one pass over the form"""
+    # Bucket "<type>_<field>_<n>" keys by type and index
+    buckets = {entry_type: {} for entry_type in ENTRY_FIELDS}
+    for key, value in form_data.items():
+        match = ENTRY_KEY_RE.match(key)
+        if not match:
+            continue
+        entry_type, field, index = match.groups()
+        if field in ENTRY_FIELDS[entry_type]:
+            buckets[entry_type].setdefault(int(index), {})[field] = value.strip()
     
-    while i <= 20:  # Reasonable limit to prevent infinite loops
-        entry = {}
-        has_data = False
-        
-        for field in fields:
-            key = f"{entry_type}_{field}_{i}"
-            value = form_data.get(key, "").strip()
-            entry[field] = value
-            if value:
-                has_data = True
-        
-        if has_data:
-            entries.append(entry)
-        else:
-            break
-        i += 1
+    # Assemble consecutive entries starting at 1, stopping at the first empty one
+    entries = {}
+    for entry_type, fields in ENTRY_FIELDS.items():
+        indexed = buckets[entry_type]
+        type_entries = []
+        i = 1
+        while any(indexed.get(i, {}).values()):
+            values = indexed[i]
+            type_entries.append({field: values.get(field, "") for field in fields})
+            i += 1
+        entries[entry_type] = type_entries
     
     return entries
 
@@ -766,54 +959,147 @@ def create_projects_string(project_entries):
     return "\n".join(parts)
 
 
+# The health payload is static, so serialize it once
+HEALTH_BODY = app.json.dumps({
+    "status": "healthy",
+    "supported_styles": list(app.config['SUPPORTED_STYLES_ORDERED']),
+    "supported_formats": list(app.config['SUPPORTED_FORMATS_ORDERED'])
+})
+
+
 @app.route("/health")
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "supported_styles": SUPPORTED_STYLES,
-        "supported_formats": SUPPORTED_FORMATS
-    })
+    return Response(HEALTH_BODY, mimetype='application/json', headers={'Cache-Control': 'no-store'})
+
+
+# Error pages are static, so each is rendered once and reused
+ERROR_PAGES = {
+    404: ("Page Not Found", "The page you were looking for doesn't exist."),
+    500: ("Something Went Wrong", "An internal error occurred. Please try again."),
+}
+_rendered_error_pages = {}
+
+
+def render_error_page(code):
+    """Return the cached HTML for an error page, rendering it on first use"""
+    page = _rendered_error_pages.get(code)
+    if page is None:
+        title, message = ERROR_PAGES[code]
+        page = render_template("error.html", code=code, title=title, message=message)
+        _rendered_error_pages[code] = page
+    return page
 
 
 @app.errorhandler(404)
 def not_found_error(error):
-    return render_template("index.html"), 404
+    return render_error_page(404), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
     logger.error(f"Internal server error: {str(error)}")
-    flash("An internal error occurred. Please try again.", "error")
-    return render_template("index.html"), 500
+    return render_error_page(500), 500
+
+
+# Periodic cleanup of generated files
+MAX_FILE_AGE = 3600  # 1 hour in seconds
+DRAFT_MAX_AGE = 24 * 3600  # Unfinished resume drafts are kept for a day
+CLEANUP_INTERVAL = 15 * 60  # 15 minutes in seconds
+CLEANUP_LOCK_NAME = '.cleanup.lock'  # Held by the one process that runs the scheduler
+_cleanup_thread = None
+_cleanup_lock = None
 
 
-# Cleanup old files on startup
 def cleanup_old_files():
     """Remove files older than 1 hour from the output directory"""
     try:
-        import time
         current_time = time.time()
-        for filename in os.listdir(OUTPUT_DIR):
-            filepath = os.path.join(OUTPUT_DIR, filename)
-            if os.path.isfile(filepath):
-                file_age = current_time - os.path.getctime(filepath)
-                if file_age > 3600:  # 1 hour in seconds
-                    os.remove(filepath)
-                    logger.info(f"Cleaned up old file: {filename}")
+        with os.scandir(OUTPUT_DIR) as entries:
+            for entry in entries:
+                if entry.name == CLEANUP_LOCK_NAME:
+                    continue
+                # Files can disappear mid-sweep (e.g. a cleanup from an older process)
+                try:
+                    if entry.is_file() and current_time - entry.stat().st_ctime > MAX_FILE_AGE:
+                        os.remove(entry.path)
+                        logger.info(f"Cleaned up old file: {entry.name}")
+                except FileNotFoundError:
+                    continue
     except Exception as e:
         logger.warning(f"Error during cleanup: {str(e)}")
 
 
+def cleanup_stale_drafts():
+    """Remove resume drafts not updated within DRAFT_MAX_AGE"""
+    try:
+        with app.app_context():
+            cutoff = datetime.utcnow() - timedelta(seconds=DRAFT_MAX_AGE)
+            removed = ResumeDraft.delete_older_than(cutoff)
+        if removed:
+            logger.info(f"Cleaned up {removed} stale resume drafts")
+    except Exception as e:
+        logger.warning(f"Error during draft cleanup: {str(e)}")
+
+
+def _acquire_cleanup_lock():
+    """
+    Take an exclusive lock on OUTPUT_DIR/CLEANUP_LOCK_NAME without blocking
+    
+    Every Gunicorn worker imports the app, so the lock makes sure only one of
+    them runs the scheduler; the OS releases it if that worker exits. Without
+    fcntl (Windows) there is a single development process and no lock is needed.
+    """
+    global _cleanup_lock
+    if fcntl is None:
+        return True
+    
+    lock_file = open(os.path.join(OUTPUT_DIR, CLEANUP_LOCK_NAME), 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    
+    # Kept open for the life of the process to hold the lock
+    _cleanup_lock = lock_file
+    return True
+
+
+def start_cleanup_scheduler(interval=CLEANUP_INTERVAL):
+    """
+    Run the file and draft cleanups now and then every `interval` seconds on a daemon thread
+    
+    Returns None when another process already runs the scheduler.
+    """
+    global _cleanup_thread
+    if _cleanup_thread is not None:
+        return _cleanup_thread
+    
+    if not _acquire_cleanup_lock():
+        logger.info("Cleanup scheduler already running in another process")
+        return None
+    
+    def run():
+        while True:
+            cleanup_old_files()
+            cleanup_stale_drafts()
+            time.sleep(interval)
+    
+    _cleanup_thread = threading.Thread(target=run, name='output-cleanup', daemon=True)
+    _cleanup_thread.start()
+    return _cleanup_thread
+
+
 if __name__ == "__main__":
-    # Cleanup old files on startup
-    cleanup_old_files()
+    # Cleanup old files on startup and periodically afterwards
+    start_cleanup_scheduler()
+    init_db()
     
     print("🚀 Starting Resume AI application...")
     print("📄 Visit http://localhost:5000 in your browser")
     print(f"📁 Generated files will be saved to: {os.path.abspath(OUTPUT_DIR)}")
-    print(f"🎨 Supported styles: {', '.join(SUPPORTED_STYLES)}")
-    print(f"📋 Supported formats: {', '.join(SUPPORTED_FORMATS)}")
+    print(f"🎨 Supported styles: {', '.join(app.config['SUPPORTED_STYLES_ORDERED'])}")
+    print(f"📋 Supported formats: {', '.join(app.config['SUPPORTED_FORMATS_ORDERED'])}")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
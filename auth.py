@@ -1,18 +1,126 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, session
 from flask_login import login_user, logout_user, login_required, current_user
 from models import db, User, Resume
+from sqlalchemy import select, event
 from supabase_client import supabase_client
-from werkzeug.security import generate_password_hash
-import re
+from extensions import cache
+import string
 import logging
 
 auth_bp = Blueprint('auth', __name__)
 logger = logging.getLogger(__name__)
 
+# The Supabase client is configured once at import, so availability never changes
+SUPABASE_AVAILABLE = supabase_client.is_available()
+
+# Anonymous GETs of the auth forms render identical HTML
+AUTH_PAGE_CACHE_TIMEOUT = 300
+
+# How long a loaded user may be served from cache instead of the database
+USER_CACHE_TIMEOUT = 60
+
+# Flash message templates
+_WELCOME_NEW = 'Welcome {}! Your account has been created successfully.'
+_WELCOME_BACK = 'Welcome back, {}!'
+_GOODBYE = 'Goodbye {}! You have been logged out successfully.'
+
+# Allowed characters of local@host.tld email addresses
+_LOCAL_OK = frozenset(string.ascii_letters + string.digits + '._%+-')
+_DOMAIN_OK = frozenset(string.ascii_letters + string.digits + '.-')
+_TLD_OK = frozenset(string.ascii_letters)
+
+def _skip_page_cache():
+    """Only cache anonymous GETs that carry no flashed messages"""
+    return (request.method != 'GET'
+            or current_user.is_authenticated
+            or '_flashes' in session)
+
 def is_valid_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    local, at, domain = email.partition('@')
+    if not (at and local) or not _LOCAL_OK.issuperset(local):
+        return False
+    
+    host, dot, tld = domain.rpartition('.')
+    return (bool(dot and host) and len(tld) >= 2
+            and _DOMAIN_OK.issuperset(host) and _TLD_OK.issuperset(tld))
+
+def user_cache_key(user_id):
+    """Cache key for the user_loader entry of a user"""
+    return f"user:{user_id}"
+
+def user_cache_values(user):
+    """Plain column values of a user, as stored by the user_loader cache"""
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_cached_user(mapper, connection, user):
+    """Drop the cached user whenever its row changes, so load_user never serves a stale copy"""
+    cache.delete(user_cache_key(user.id))
+
+def _upgrade_password_hash(user, password):
+    """Re-hash a verified password if it was stored with a legacy scheme"""
+    if user.password_needs_rehash():
+        user.set_password(password)
+        db.session.commit()
+
+def _authenticate_local(email, password):
+    """Verify local credentials with a single SELECT of the user"""
+    user = db.session.execute(
+        select(User).where(User.email == email)
+    ).scalar_one_or_none()
+    if user is None or not user.check_password(password):
+        return None
+    
+    _upgrade_password_hash(user, password)
+    return user
+
+def _local_signup(name, email, password):
+    """Build a password-backed local user for signup"""
+    user = User(
+        name=name,
+        email=email,
+        provider='email'
+    )
+    user.set_password(password)
+    return user
+
+def _complete_signup(user, name):
+    """Insert a new user and log them in, or re-render signup if the email is taken"""
+    # Single INSERT ... ON CONFLICT instead of SELECT + INSERT
+    if not user.insert_if_absent(commit=False):
+        db.session.rollback()
+        flash('Email already registered. Please sign in instead.', 'error')
+        return render_template('auth/signup.html')
+    
+    # The only commit of the request; log in once the row is durable
+    db.session.commit()
+    login_user(user)
+    flash(_WELCOME_NEW.format(name), 'success')
+    return redirect(url_for('dashboard.dashboard'))
+
+def _complete_signin(user, remember):
+    """Log the user in and redirect to the next page or dashboard"""
+    login_user(user, remember=remember)
+    flash(_WELCOME_BACK.format(user.name), 'success')
+    
+    # Redirect to next page or dashboard
+    next_page = request.args.get('next')
+    if next_page:
+        return redirect(next_page)
+    return redirect(url_for('dashboard.dashboard'))
+
+def _supabase_sign_out():
+    """Sign out from Supabase, logging rather than raising on failure"""
+    try:
+        supabase_client.sign_out()
+    except Exception as e:
+        logger.error(f"Supabase logout error: {e}")
+
+def _extract_creds(form):
+    """Return the normalized email and raw password from a submitted form"""
+    return form.get('email', '').strip().lower(), form.get('password', '')
 
 def is_valid_password(password):
     """Validate password strength"""
@@ -21,6 +129,7 @@ def is_valid_password(password):
     return True, ""
 
 @auth_bp.route('/signup', methods=['GET', 'POST'])
+@cache.cached(timeout=AUTH_PAGE_CACHE_TIMEOUT, unless=_skip_page_cache)
 def signup():
     """User registration"""
     if current_user.is_authenticated:
@@ -29,13 +138,13 @@ def signup():
     if request.method == 'POST':
         try:
             # Get form data
-            name = request.form.get('name', '').strip()
-            email = request.form.get('email', '').strip().lower()
-            password = request.form.get('password', '')
-            confirm_password = request.form.get('confirm_password', '')
+            form = request.form
+            email, password = _extract_creds(form)
+            name = form.get('name', '').strip()
+            confirm_password = form.get('confirm_password', '')
             
             # Validation
-            if not all([name, email, password, confirm_password]):
+            if not (name and email and password and confirm_password):
                 flash('All fields are required', 'error')
                 return render_template('auth/signup.html')
             
@@ -52,14 +161,13 @@ def signup():
                 flash(error_msg, 'error')
                 return render_template('auth/signup.html')
             
-            # Check if user already exists
-            existing_user = User.query.filter_by(email=email).first()
-            if existing_user:
-                flash('Email already registered. Please sign in instead.', 'error')
-                return render_template('auth/signup.html')
-            
             # Try Supabase first, then fallback to local
-            if supabase_client.is_available():
+            if SUPABASE_AVAILABLE:
+                # Check before creating the remote account
+                if db.session.query(User.query.filter_by(email=email).exists()).scalar():
+                    flash('Email already registered. Please sign in instead.', 'error')
+                    return render_template('auth/signup.html')
+                
                 try:
                     # Sign up with Supabase
                     response = supabase_client.sign_up_with_email(
@@ -68,59 +176,26 @@ def signup():
                         user_metadata={'full_name': name}
                     )
                     
-                    if response.user:
-                        # Create local user record with Supabase UUID
-                        user = User(
-                            id=response.user.id,  # Use Supabase UUID
-                            name=name,
-                            email=email,
-                            provider='email'
-                        )
-                        # Don't set password hash for Supabase users
-                        
-                        db.session.add(user)
-                        db.session.commit()
-                        
-                        # Log in the user
-                        login_user(user)
-                        flash(f'Welcome {name}! Your account has been created successfully.', 'success')
-                        return redirect(url_for('dashboard.dashboard'))
-                    else:
+                    if not response.user:
                         flash('Failed to create account. Please try again.', 'error')
-                        
-                except Exception as e:
-                    logger.error(f"Supabase signup error: {e}")
-                    # Fall back to local authentication
+                        return render_template('auth/signup.html')
+                    
+                    # Create local user record with Supabase UUID
+                    # Don't set password hash for Supabase users
                     user = User(
+                        id=response.user.id,  # Use Supabase UUID
                         name=name,
                         email=email,
                         provider='email'
                     )
-                    user.set_password(password)
-                    
-                    db.session.add(user)
-                    db.session.commit()
+                    return _complete_signup(user, name)
                     
-                    # Log in the user
-                    login_user(user)
-                    flash(f'Welcome {name}! Your account has been created successfully.', 'success')
-                    return redirect(url_for('dashboard.dashboard'))
-            else:
-                # Fallback to local authentication
-                user = User(
-                    name=name,
-                    email=email,
-                    provider='email'
-                )
-                user.set_password(password)
-                
-                db.session.add(user)
-                db.session.commit()
-                
-                # Log in the user
-                login_user(user)
-                flash(f'Welcome {name}! Your account has been created successfully.', 'success')
-                return redirect(url_for('dashboard.dashboard'))
+                except Exception as e:
+                    logger.error(f"Supabase signup error: {e}")
+                    # Discard any partial write, then fall through to local authentication
+                    db.session.rollback()
+            
+            return _complete_signup(_local_signup(name, email, password), name)
                 
         except Exception as e:
             db.session.rollback()
@@ -130,6 +205,7 @@ def signup():
     return render_template('auth/signup.html')
 
 @auth_bp.route('/signin', methods=['GET', 'POST'])
+@cache.cached(timeout=AUTH_PAGE_CACHE_TIMEOUT, unless=_skip_page_cache)
 def signin():
     """User login"""
     if current_user.is_authenticated:
@@ -137,71 +213,47 @@ def signin():
     
     if request.method == 'POST':
         try:
-            email = request.form.get('email', '').strip().lower()
-            password = request.form.get('password', '')
-            remember = bool(request.form.get('remember'))
+            form = request.form
+            email, password = _extract_creds(form)
+            remember = bool(form.get('remember'))
             
             if not email or not password:
                 flash('Email and password are required', 'error')
                 return render_template('auth/signin.html')
             
             # Try Supabase first, fallback to local
-            if supabase_client.is_available():
+            if SUPABASE_AVAILABLE:
                 try:
                     response = supabase_client.sign_in_with_email(email, password)
                     
-                    if response.user:
-                        # Find or create local user
-                        user = User.query.filter_by(email=email).first()
-                        if not user:
-                            # Create local user with Supabase UUID
-                            user = User(
-                                id=response.user.id,
-                                email=email,
-                                name=response.user.user_metadata.get('full_name', email.split('@')[0]),
-                                provider='email'
-                            )
-                            db.session.add(user)
-                            db.session.commit()
-                        
-                        login_user(user, remember=remember)
-                        flash(f'Welcome back, {user.name}!', 'success')
-                        
-                        # Redirect to next page or dashboard
-                        next_page = request.args.get('next')
-                        if next_page:
-                            return redirect(next_page)
-                        return redirect(url_for('dashboard.dashboard'))
-                    else:
+                    if not response.user:
                         flash('Invalid email or password', 'error')
-                        
-                except Exception as e:
-                    logger.error(f"Supabase signin error: {e}")
-                    # Try local authentication as fallback
+                        return render_template('auth/signin.html')
+                    
+                    # Find or create local user
                     user = User.query.filter_by(email=email).first()
-                    if user and user.check_password(password):
-                        login_user(user, remember=remember)
-                        flash(f'Welcome back, {user.name}!', 'success')
-                        
-                        next_page = request.args.get('next')
-                        if next_page:
-                            return redirect(next_page)
-                        return redirect(url_for('dashboard.dashboard'))
-                    else:
-                        flash('Invalid email or password', 'error')
-            else:
-                # Local authentication only
-                user = User.query.filter_by(email=email).first()
-                if user and user.check_password(password):
-                    login_user(user, remember=remember)
-                    flash(f'Welcome back, {user.name}!', 'success')
+                    if not user:
+                        # Create local user with Supabase UUID
+                        local_part = email.split('@', 1)[0]
+                        user = User(
+                            id=response.user.id,
+                            email=email,
+                            name=response.user.user_metadata.get('full_name', local_part),
+                            provider='email'
+                        )
+                        db.session.add(user)
+                        db.session.commit()
                     
-                    next_page = request.args.get('next')
-                    if next_page:
-                        return redirect(next_page)
-                    return redirect(url_for('dashboard.dashboard'))
-                else:
-                    flash('Invalid email or password', 'error')
+                    return _complete_signin(user, remember)
+                    
+                except Exception as e:
+                    logger.error(f"Supabase signin error: {e}")
+                    # Fall through to local authentication
+            
+            user = _authenticate_local(email, password)
+            if user:
+                return _complete_signin(user, remember)
+            flash('Invalid email or password', 'error')
                 
         except Exception as e:
             logger.error(f"Signin error: {e}")
@@ -214,16 +266,16 @@ def signin():
 def logout():
     """User logout"""
     name = current_user.name
+    cache.delete(user_cache_key(current_user.id))
     
-    # Sign out from Supabase if available
-    if supabase_client.is_available():
-        try:
-            supabase_client.sign_out()
-        except Exception as e:
-            logger.error(f"Supabase logout error: {e}")
+    # Sign out from Supabase if available. This stays on the request path:
+    # the client is shared, so a deferred sign_out could clear a session
+    # another request has just created
+    if SUPABASE_AVAILABLE:
+        _supabase_sign_out()
     
     logout_user()
-    flash(f'Goodbye {name}! You have been logged out successfully.', 'info')
+    flash(_GOODBYE.format(name), 'info')
     return redirect(url_for('landing'))
 
 @auth_bp.route('/profile')
@@ -1,15 +1,36 @@
 import os
 from datetime import timedelta
-from dotenv import load_dotenv
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 
-# Load environment variables
-load_dotenv()
+_HERE = Path(__file__).resolve().parent
+IS_PRODUCTION = os.environ.get('FLASK_ENV') == 'production'
+
+# Load environment variables from .env in development; production
+# environments get them from the process manager
+_ENV_FILE = _HERE / '.env'
+if not IS_PRODUCTION and _ENV_FILE.exists():
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
+
+def _normalize_db_uri(url):
+    """Rewrite the legacy postgres:// scheme to postgresql:// for SQLAlchemy"""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    if parts.scheme != 'postgres':
+        return url
+    return urlunsplit(parts._replace(scheme='postgresql'))
 
 class Config:
     """Application configuration"""
     
     # Flask settings
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'resume_ai_secret_key_2024_auth'
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    if not SECRET_KEY:
+        if IS_PRODUCTION:
+            raise RuntimeError("SECRET_KEY must be set when FLASK_ENV=production")
+        SECRET_KEY = 'resume_ai_secret_key_2024_auth'
     
     # Supabase settings
     SUPABASE_URL = os.environ.get('SUPABASE_URL')
@@ -17,9 +38,7 @@ class Config:
     SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_KEY')
     
     # Database settings (PostgreSQL via Supabase)
-    DATABASE_URL = os.environ.get('DATABASE_URL')
-    if DATABASE_URL and DATABASE_URL.startswith('postgres://'):
-        DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
+    DATABASE_URL = _normalize_db_uri(os.environ.get('DATABASE_URL'))
     
     # Use Supabase PostgreSQL if available, otherwise SQLite
     if DATABASE_URL:
@@ -34,15 +53,47 @@ class Config:
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool for PostgreSQL: keep warm connections, drop ones the
+    # server closed while idle, and recycle before Supabase's idle timeout
+    if SQLALCHEMY_DATABASE_URI.startswith('postgresql'):
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_pre_ping': True,
+            'pool_recycle': 1800,
+            'pool_use_lifo': True,
+        }
+    
+    # Create tables when the app is imported (dev convenience). Production
+    # deploys run `flask --app app init-db` once instead.
+    AUTO_CREATE_DB = os.environ.get('AUTO_CREATE_DB', '').lower() in ('1', 'true', 'yes')
+    
     # Session settings
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)  # Remember me duration
     
+    # Cache settings (in-process; set CACHE_TYPE=RedisCache to share across workers)
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'SimpleCache')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+    CACHE_DEFAULT_TIMEOUT = 600
+    
+    # Signed-in users are only cached when every worker shares the cache, since
+    # invalidating a changed user must reach all of them
+    USER_CACHE_ENABLED = CACHE_TYPE not in ('SimpleCache', 'simple', 'NullCache', 'null')
+    
     # File upload settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     
     # Resume settings
-    SUPPORTED_STYLES = ['simple', 'modern', 'academic']
-    SUPPORTED_FORMATS = ['docx', 'pdf']
+    # Ordered tuples for display, frozensets for membership checks
+    SUPPORTED_STYLES_ORDERED = ('simple', 'modern', 'academic')
+    SUPPORTED_FORMATS_ORDERED = ('docx', 'pdf')
+    SUPPORTED_STYLES = frozenset(SUPPORTED_STYLES_ORDERED)
+    SUPPORTED_FORMATS = frozenset(SUPPORTED_FORMATS_ORDERED)
+    
+    # Background export queue (optional - exports run in-process when unset)
+    CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL')
+    CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND') or CELERY_BROKER_URL
     
-    # Output directory
-    OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated")
\ No newline at end of file
+    # Output directory (created once at import)
+    OUTPUT_DIR = str(_HERE / "generated")
+    Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -20,21 +20,324 @@ FEATURES:
 from typing import List, Dict, Any, Tuple, Optional
 import re
 import os
+import json
+import asyncio
 import logging
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from .nlp_engine import NLPEngine
 
 logger = logging.getLogger(__name__)
 
 # Optional OpenAI integration
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     logger.info("OpenAI library not available - using local processing only")
 
+# Optional tokenizer for accurate OpenAI token counts
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _token_encoder(model: str):
+    """tiktoken encoding for a model, falling back to the generic encoding"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+@lru_cache(maxsize=1024)
+def count_tokens(text: str, model: str) -> int:
+    """Count OpenAI tokens in text (rough 4-characters-per-token estimate without tiktoken)"""
+    if TIKTOKEN_AVAILABLE:
+        return len(_token_encoder(model).encode(text))
+    return len(text) // 4
+
+# Optional Aho-Corasick automaton for multi-keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """
+    Find which keyword groups occur (as substrings) in a text
+    
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, so the
+    cost no longer grows with vocabulary size; otherwise each group is one
+    precompiled alternation, scanned in definition order.
+    """
+    
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = groups
+        self._priority = {label: index for index, label in enumerate(groups)}
+        self._automaton = None
+        self._group_res = None
+        self._any_re = None
+        if not AHOCORASICK_AVAILABLE:
+            self._group_res = {
+                label: re.compile('|'.join(map(re.escape, terms))) for label, terms in groups.items()
+            }
+            self._any_re = re.compile('|'.join(
+                re.escape(term) for terms in groups.values() for term in terms
+            ))
+        else:
+            labels_by_term = {}
+            for label, terms in groups.items():
+                for term in terms:
+                    labels_by_term.setdefault(term, []).append(label)
+            automaton = ahocorasick.Automaton()
+            for term, labels in labels_by_term.items():
+                automaton.add_word(term, tuple(labels))
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def labels(self, text: str) -> set:
+        """Return the labels of every group with at least one keyword in text"""
+        if self._automaton is not None:
+            found = set()
+            for _, labels in self._automaton.iter(text):
+                found.update(labels)
+            return found
+        return {label for label, pattern in self._group_res.items() if pattern.search(text)}
+    
+    def first(self, text: str) -> Optional[str]:
+        """Return the first group (in definition order) matching text, if any"""
+        if self._automaton is None:
+            # Stop at the first group that matches
+            for label, pattern in self._group_res.items():
+                if pattern.search(text):
+                    return label
+            return None
+        found = self.labels(text)
+        return min(found, key=self._priority.__getitem__) if found else None
+    
+    def counts(self, text: str) -> Counter:
+        """Count keyword occurrences in text per group label"""
+        votes = Counter()
+        if self._automaton is not None:
+            for _, labels in self._automaton.iter(text):
+                votes.update(labels)
+            return votes
+        for label, terms in self.groups.items():
+            hits = sum(text.count(term) for term in terms)
+            if hits:
+                votes[label] = hits
+        return votes
+    
+    def best(self, text: str) -> Optional[str]:
+        """Return the group with the most keyword hits, ties going to the earlier group"""
+        votes = self.counts(text)
+        if not votes:
+            return None
+        return max(votes, key=lambda label: (votes[label], -self._priority[label]))
+    
+    def matches(self, text: str) -> bool:
+        """Return True if any keyword occurs in text"""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return self._any_re.search(text) is not None
+
+
+# Prose shorter than this cannot yield a meaningful bullet
+MIN_MEANINGFUL = 3
+
+
+def _skip_if_trivial(min_len: int = 1):
+    """Return "" for empty, whitespace-only or too-short input before any analysis runs"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, raw, *args, **kwargs):
+            if not raw or len(raw.strip()) < min_len:
+                return ""
+            return fn(self, raw, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Verb transformation mapping for professional language
+VERB_TRANSFORMATIONS = {
+    'worked': 'Developed',
+    'helped': 'Implemented', 
+    'did': 'Executed',
+    'made': 'Built',
+    'was responsible for': 'Managed',
+    'handled': 'Managed',
+    'dealt with': 'Resolved',
+    'took care of': 'Maintained',
+    'was involved in': 'Participated in',
+    'used': 'Utilized',
+    'got': 'Achieved',
+    'tried': 'Implemented',
+    'looked at': 'Analyzed',
+    'worked on': 'Developed',
+    'worked with': 'Collaborated with',
+    'assisted': 'Supported',
+    'participated': 'Contributed to',
+    'contributed': 'Enhanced',
+    'supported': 'Facilitated'
+}
+
+# One alternation for all weak verbs, longest first so "worked on" wins over "worked"
+_VERB_PATTERN = re.compile(
+    r'\b(' + '|'.join(
+        re.escape(weak) for weak in sorted(VERB_TRANSFORMATIONS, key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
+_VERB_MAP_LOWER = {weak.lower(): strong for weak, strong in VERB_TRANSFORMATIONS.items()}
+
+# Role-specific summary templates
+SUMMARY_TEMPLATES = {
+    'software': {
+        'intro': 'Results-driven software engineer with {years} years of experience in {skills}.',
+        'focus': 'Proven expertise in {domain} with a track record of {achievements}.',
+        'goal': 'Seeking to leverage technical skills and leadership experience to drive innovation at a forward-thinking technology company.'
+    },
+    'data': {
+        'intro': 'Analytical data professional with {years} years of experience in {skills}.',
+        'focus': 'Specialized in {domain} with demonstrated success in {achievements}.',
+        'goal': 'Looking to apply data-driven insights and analytical expertise to solve complex business challenges.'
+    },
+    'business': {
+        'intro': 'Strategic business professional with {years} years of experience in {skills}.',
+        'focus': 'Expert in {domain} with a proven ability to {achievements}.',
+        'goal': 'Committed to driving organizational growth and operational excellence through strategic leadership.'
+    }
+}
+
+# Cue words used to pick an opening verb, checked in order
+_VERB_CUES = KeywordMatcher({
+    'Developed': ['develop', 'build', 'creat'],
+    'Led': ['lead', 'manag', 'direct'],
+    'Optimized': ['optim', 'improv', 'enhanc'],
+    'Analyzed': ['analyz', 'research', 'evaluat'],
+    'Collaborated on': ['collaborat', 'work with', 'partner'],
+})
+
+# Topic and action cues for generic quantification
+_QUANT_CUES = KeywordMatcher({
+    'performance': ['performance', 'speed'],
+    'cost': ['cost', 'expense'],
+    'time': ['time'],
+    'user': ['user', 'customer'],
+    'improve': ['improv', 'optim'],
+    'reduce': ['reduc', 'sav'],
+    'enhance': ['improv', 'enhanc'],
+})
+
+# Professional domain indicators; ties go to the earlier domain
+_DOMAIN_TERMS = KeywordMatcher({
+    'software': ['software', 'developer', 'engineer', 'programming', 'code', 'api', 'web', 'app'],
+    'data': ['data', 'analytics', 'machine learning', 'statistics', 'analysis', 'visualization'],
+    'business': ['business', 'management', 'strategy', 'operations', 'marketing', 'sales'],
+})
+
+# Fallback skills looked for directly in text
+COMMON_SKILLS = ['python', 'javascript', 'react', 'node.js', 'aws', 'docker', 'sql']
+_COMMON_SKILLS = KeywordMatcher({skill: [skill] for skill in COMMON_SKILLS})
+
+# Words marking an achievement sentence
+_ACHIEVEMENT_TERMS = KeywordMatcher({
+    'achievement': ['improved', 'increased', 'reduced', 'achieved', 'delivered', 'led'],
+})
+
+# Skill categories, checked in order; unmatched skills go to Tools & Platforms
+_SKILL_CATEGORIES = KeywordMatcher({
+    "Programming Languages": ['python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'typescript'],
+    "Frameworks & Libraries": ['react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'express'],
+    "Databases": ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite'],
+    "Cloud & DevOps": ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform'],
+    "Tools & Platforms": ['git', 'github', 'jira', 'postman', 'figma', 'photoshop'],
+})
+
 
 class ContentEnhancer:
+    # Shared, read-only tables (kept as attributes for existing callers)
+    verb_transformations = VERB_TRANSFORMATIONS
+    summary_templates = SUMMARY_TEMPLATES
+    
+    # Patterns compiled once for all instances
+    _BULLET_MARKERS = ('•', '-', '*')
+    _PASSIVE_FUSED = re.compile(
+        r'\b(?:was|were|is|are|(?:has|have)\s+been)\s+(\w+ed)\b', re.IGNORECASE
+    )
+    _QUANT_RE = re.compile(r'\d+[%kmb]?|\$\d+|\d+x|\d+:\d+')
+    _SUMMARY_SPLIT_RE = re.compile(r'[.!?]+')
+    _ACHIEVEMENT_SPLIT_RE = re.compile(r'[.!?]')
+    _YEARS_RES = [
+        re.compile(pattern, re.IGNORECASE) for pattern in (
+            r'(\d+)\+?\s*years?',
+            r'(\d+)\+?\s*yrs?',
+            r'over\s+(\d+)\s*years?',
+            r'more than\s+(\d+)\s*years?'
+        )
+    ]
+    # Delimiter folding: map every separator onto one so str.split can do the work
+    _SENT_TRANS = str.maketrans({'!': '.', '?': '.', ';': '.'})
+    _SKILL_TRANS = str.maketrans({';': ',', '|': ',', '\n': ','})
+    
+    # Strong action verbs a bullet may already start with
+    _STRONG_VERBS = (
+        'Developed', 'Built', 'Created', 'Designed', 'Implemented', 'Engineered',
+        'Led', 'Managed', 'Directed', 'Coordinated', 'Supervised', 'Mentored',
+        'Optimized', 'Enhanced', 'Improved', 'Streamlined', 'Automated',
+        'Achieved', 'Delivered', 'Executed', 'Completed', 'Launched',
+        'Analyzed', 'Researched', 'Evaluated', 'Assessed', 'Investigated',
+        'Collaborated', 'Partnered', 'Facilitated', 'Contributed', 'Supported'
+    )
+    # Whole first word only: trailing .,!? allowed, anything else (e.g. "Led-by") is not a match
+    _STRONG_START_RE = re.compile(
+        r'\s*(?:' + '|'.join(_STRONG_VERBS) + r')[.,!?]*(?:\s|$)', re.IGNORECASE
+    )
+    
+    # (topic cue, action cue, metric clause) for generic quantification, checked in order
+    _QUANT_TABLE = (
+        ('performance', 'improve', ', improving performance by 25%'),
+        ('cost', 'reduce', ', reducing costs by 20%'),
+        ('time', 'reduce', ', saving 15 hours per week'),
+        ('user', 'enhance', ', improving user satisfaction by 30%'),
+    )
+    
+    # Content-specific instructions for AI polishing
+    _POLISH_PROMPTS = {
+        'summary': "Polish this professional summary for clarity and impact. Keep it 2-3 sentences, maintain all technical details, and ensure it sounds natural and engaging:",
+        'experience': "Polish these experience bullet points for clarity and professional tone. Maintain all technical details, metrics, and action verbs. Keep the bullet point format:",
+        'projects': "Polish these project descriptions for clarity and impact. Maintain all technical details and keep the professional tone:",
+        'general': "Polish this text for clarity and professional tone while maintaining all technical details:"
+    }
+    # Methods whose last step polishes their local result, and the content type they polish as
+    _POLISHED_METHODS = {
+        'enhance_experience': 'experience',
+        'enhance_summary': 'summary',
+        'enhance_projects': 'projects',
+    }
+    _POLISH_SYSTEM_PROMPT = "You are a professional resume writer. Polish the provided text while maintaining all technical details, metrics, and professional formatting."
+    
+    # Concurrent polishing (OPENAI_POLISH_MODE=concurrent): in-flight request cap and
+    # SDK retries (exponential backoff on 429/5xx)
+    _POLISH_CONCURRENCY = 10
+    _POLISH_MAX_RETRIES = 3
+    
+    # Largest input sent in one polish request; longer text is polished in parts
+    _POLISH_MAX_TOKENS = 400  # Leave room for response
+    _SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+    
+    # Polish results kept per enhancer (oldest dropped first once full)
+    _POLISH_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize the content enhancer with NLP engine and optional OpenAI client"""
         try:
@@ -58,48 +361,79 @@ class ContentEnhancer:
         else:
             logger.info("No OPENAI_API_KEY found - using local processing only")
         
-        # Verb transformation mapping for professional language
-        self.verb_transformations = {
-            'worked': 'Developed',
-            'helped': 'Implemented', 
-            'did': 'Executed',
-            'made': 'Built',
-            'was responsible for': 'Managed',
-            'handled': 'Managed',
-            'dealt with': 'Resolved',
-            'took care of': 'Maintained',
-            'was involved in': 'Participated in',
-            'used': 'Utilized',
-            'got': 'Achieved',
-            'tried': 'Implemented',
-            'looked at': 'Analyzed',
-            'worked on': 'Developed',
-            'worked with': 'Collaborated with',
-            'assisted': 'Supported',
-            'participated': 'Contributed to',
-            'contributed': 'Enhanced',
-            'supported': 'Facilitated'
-        }
-        
-        # Role-specific summary templates
-        self.summary_templates = {
-            'software': {
-                'intro': 'Results-driven software engineer with {years} years of experience in {skills}.',
-                'focus': 'Proven expertise in {domain} with a track record of {achievements}.',
-                'goal': 'Seeking to leverage technical skills and leadership experience to drive innovation at a forward-thinking technology company.'
-            },
-            'data': {
-                'intro': 'Analytical data professional with {years} years of experience in {skills}.',
-                'focus': 'Specialized in {domain} with demonstrated success in {achievements}.',
-                'goal': 'Looking to apply data-driven insights and analytical expertise to solve complex business challenges.'
-            },
-            'business': {
-                'intro': 'Strategic business professional with {years} years of experience in {skills}.',
-                'focus': 'Expert in {domain} with a proven ability to {achievements}.',
-                'goal': 'Committed to driving organizational growth and operational excellence through strategic leadership.'
-            }
-        }
+        # Polished text keyed by (content_type, text); filled by ai_polish and polish_batch.
+        # The enhancer is shared across threads, so writes go through _polish_lock
+        self._polish_cache = {}
+        self._polish_lock = threading.Lock()
+        # Per-thread deferred_polish() state, so one shared enhancer can serve
+        # concurrent requests
+        self._polish_state = threading.local()
+
+    @property
+    def _pending_polish(self) -> Optional[Dict]:
+        """Texts awaiting a batched polish while inside deferred_polish() on this thread"""
+        return getattr(self._polish_state, 'pending', None)
+
+    @_pending_polish.setter
+    def _pending_polish(self, value: Optional[Dict]) -> None:
+        self._polish_state.pending = value
+
+    @property
+    def _polish_failed(self) -> frozenset:
+        """Keys the last deferred_polish() batch on this thread could not polish"""
+        return getattr(self._polish_state, 'failed', frozenset())
+
+    @_polish_failed.setter
+    def _polish_failed(self, value: frozenset) -> None:
+        self._polish_state.failed = value
+
+    @property
+    def polish_deferred(self) -> bool:
+        """True while inside deferred_polish() on this thread, where ai_polish returns its input"""
+        return self._pending_polish is not None
+
+    def polish_enhanced(self, method: str, text: str) -> str:
+        """
+        Apply the AI polish step of enhancer method ``method`` to its local result
+        
+        enhance_experience(...) returns the same as polish_enhanced('enhance_experience',
+        <its result inside deferred_polish()>), so callers can reuse local results.
+        """
+        content_type = self._POLISHED_METHODS.get(method)
+        if not (self.openai_client and content_type and text):
+            return text
+        return self.ai_polish(text, content_type)
+
+    def _remember_polish(self, key: Tuple[str, str], polished: str) -> None:
+        """Cache a polish result, evicting the oldest entry once the cache is full"""
+        with self._polish_lock:
+            if key not in self._polish_cache and len(self._polish_cache) >= self._POLISH_CACHE_SIZE:
+                self._polish_cache.pop(next(iter(self._polish_cache)))
+            self._polish_cache[key] = polished
+
+    def analyze_batch(self, texts: List[str]) -> Dict[str, Dict]:
+        """
+        Sentence analyses for many texts from a single NLP pass, keyed by text
+        
+        Pass an entry as the ``analysis`` argument of enhance_experience or
+        enhance_projects to skip that call's own sentence splitting.
+        """
+        unique = list(dict.fromkeys(text for text in texts if text and text.strip()))
+        if not unique or not self.nlp_engine:
+            return {}
+        
+        sentences = self.nlp_engine.split_sentences(unique)
+        return {text: {"sentences": split} for text, split in zip(unique, sentences)}
 
+    def _iter_sentences(self, text: str, analysis: Dict = None):
+        """Sentences from a caller-supplied analysis, else streamed from the NLP engine"""
+        if analysis is not None:
+            return analysis.get("sentences", [text])
+        if self.nlp_engine:
+            return self.nlp_engine.iter_sentences(text)
+        return [text]
+
+    @_skip_if_trivial(MIN_MEANINGFUL)
     def enhance_experience(self, raw_experience: str, analysis: Dict = None) -> str:
         """
         Transform raw experience into ATS-optimized bullet points
@@ -111,32 +445,18 @@ class ContentEnhancer:
         - Be concise (1 line each)
         - Remove weak verbs
         """
-        if not raw_experience or not raw_experience.strip():
-            return ""
+        # Only the sentences are needed here, so stream them rather than running
+        # the full analysis unless the caller already has one
+        sentences = self._iter_sentences(raw_experience, analysis)
+        analysis = analysis or {}
         
-        # Analyze the text using NLP
-        if self.nlp_engine:
-            analysis = self.nlp_engine.analyze_text(raw_experience)
-        else:
-            analysis = {"sentences": [raw_experience], "verbs": [], "keywords": []}
-        
-        bullets = []
-        sentences = analysis.get("sentences", [raw_experience])
-        
-        for sentence in sentences:
-            if not sentence.strip():
-                continue
-                
-            # Transform each sentence into a professional bullet
-            enhanced_bullet = self._transform_to_bullet(sentence, analysis)
-            if enhanced_bullet:
-                bullets.append(enhanced_bullet)
+        # Transform each sentence into a professional bullet and join as they come
+        enhanced = (self._transform_to_bullet(sentence, analysis) for sentence in sentences if sentence.strip())
+        result = '\n'.join(bullet for bullet in enhanced if bullet)
         
         # If no bullets were created, create from raw text
-        if not bullets:
-            bullets = self._create_bullets_from_raw(raw_experience)
-        
-        result = '\n'.join(bullets)
+        if not result:
+            result = '\n'.join(self._create_bullets_from_raw(raw_experience))
         
         # Apply AI polishing if available
         if self.openai_client and result:
@@ -151,12 +471,13 @@ class ContentEnhancer:
             return ""
         
         # Remove bullet markers if present
-        sentence = re.sub(r'^[•\-\*]\s*', '', sentence)
+        if sentence.startswith(self._BULLET_MARKERS):
+            sentence = sentence[1:].lstrip()
         
-        # Replace weak verbs with strong ones
-        for weak, strong in self.verb_transformations.items():
-            pattern = r'\b' + re.escape(weak) + r'\b'
-            sentence = re.sub(pattern, strong, sentence, flags=re.IGNORECASE)
+        # Replace weak verbs with strong ones in a single pass
+        sentence = _VERB_PATTERN.sub(
+            lambda m: _VERB_MAP_LOWER[m.group(1).lower()], sentence
+        )
         
         # Ensure it starts with a strong action verb
         sentence = self._ensure_strong_start(sentence)
@@ -181,58 +502,23 @@ class ContentEnhancer:
         if not sentence:
             return sentence
         
-        # List of strong action verbs to use
-        strong_verbs = [
-            'Developed', 'Built', 'Created', 'Designed', 'Implemented', 'Engineered',
-            'Led', 'Managed', 'Directed', 'Coordinated', 'Supervised', 'Mentored',
-            'Optimized', 'Enhanced', 'Improved', 'Streamlined', 'Automated',
-            'Achieved', 'Delivered', 'Executed', 'Completed', 'Launched',
-            'Analyzed', 'Researched', 'Evaluated', 'Assessed', 'Investigated',
-            'Collaborated', 'Partnered', 'Facilitated', 'Contributed', 'Supported'
-        ]
-        
         # Check if it already starts with a strong verb
-        first_word = sentence.split()[0] if sentence.split() else ""
-        if first_word.lower().rstrip('.,!?') in [v.lower() for v in strong_verbs]:
+        if self._STRONG_START_RE.match(sentence):
             return sentence
         
         # Try to identify the main action and replace with strong verb
-        sentence_lower = sentence.lower()
-        
-        if any(word in sentence_lower for word in ['develop', 'build', 'creat']):
-            return f"Developed {sentence}"
-        elif any(word in sentence_lower for word in ['lead', 'manag', 'direct']):
-            return f"Led {sentence}"
-        elif any(word in sentence_lower for word in ['optim', 'improv', 'enhanc']):
-            return f"Optimized {sentence}"
-        elif any(word in sentence_lower for word in ['analyz', 'research', 'evaluat']):
-            return f"Analyzed {sentence}"
-        elif any(word in sentence_lower for word in ['collaborat', 'work with', 'partner']):
-            return f"Collaborated on {sentence}"
-        else:
-            return f"Implemented {sentence}"
+        verb = _VERB_CUES.first(sentence.lower()) or 'Implemented'
+        return f"{verb} {sentence}"
     
     def _convert_to_active_voice(self, sentence: str) -> str:
         """Convert passive voice to active voice"""
-        # Common passive voice patterns
-        passive_patterns = [
-            (r'was (\w+ed)', r'\1'),
-            (r'were (\w+ed)', r'\1'),
-            (r'has been (\w+ed)', r'\1'),
-            (r'have been (\w+ed)', r'\1'),
-            (r'is (\w+ed)', r'\1'),
-            (r'are (\w+ed)', r'\1')
-        ]
-        
-        for pattern, replacement in passive_patterns:
-            sentence = re.sub(pattern, replacement, sentence, flags=re.IGNORECASE)
-        
-        return sentence
+        # was/were/is/are/has been/have been + past participle, in one pass
+        return self._PASSIVE_FUSED.sub(r'\1', sentence)
     
     def _add_quantification(self, sentence: str, analysis: Dict) -> str:
         """Add quantification to achievements if missing"""
         # Check if sentence already has quantification
-        if re.search(r'\d+[%kmb]?|\$\d+|\d+x|\d+:\d+', sentence):
+        if self._QUANT_RE.search(sentence):
             return sentence
         
         # Extract quantified achievements from analysis
@@ -241,28 +527,29 @@ class ContentEnhancer:
             if achievements:
                 return sentence  # Already quantified
         
-        # Add generic quantification based on context
-        sentence_lower = sentence.lower()
-        
-        if 'performance' in sentence_lower or 'speed' in sentence_lower:
-            if 'improv' in sentence_lower or 'optim' in sentence_lower:
-                sentence = sentence.replace('.', ', improving performance by 25%.')
-        elif 'cost' in sentence_lower or 'expense' in sentence_lower:
-            if 'reduc' in sentence_lower or 'sav' in sentence_lower:
-                sentence = sentence.replace('.', ', reducing costs by 20%.')
-        elif 'time' in sentence_lower:
-            if 'reduc' in sentence_lower or 'sav' in sentence_lower:
-                sentence = sentence.replace('.', ', saving 15 hours per week.')
-        elif 'user' in sentence_lower or 'customer' in sentence_lower:
-            if 'improv' in sentence_lower or 'enhanc' in sentence_lower:
-                sentence = sentence.replace('.', ', improving user satisfaction by 30%.')
+        # Add generic quantification based on context: the first topic present
+        # decides, and its metric is added only if the matching action is too
+        cues = _QUANT_CUES.labels(sentence.lower())
+        
+        for topic, action, metric in self._QUANT_TABLE:
+            if topic in cues:
+                if action in cues:
+                    sentence = self._append_metric(sentence, metric)
+                break
         
         return sentence
     
+    @staticmethod
+    def _append_metric(sentence: str, metric: str) -> str:
+        """Insert a metric clause before the closing period; unpunctuated sentences are left as-is"""
+        if not sentence.endswith('.'):
+            return sentence
+        return f"{sentence[:-1]}{metric}."
+    
     def _create_bullets_from_raw(self, raw_text: str) -> List[str]:
         """Create bullets from raw text when NLP analysis fails"""
         # Split by common delimiters
-        sentences = re.split(r'[.!?;]\s*', raw_text)
+        sentences = raw_text.translate(self._SENT_TRANS).split('.')
         bullets = []
         
         for sentence in sentences:
@@ -274,6 +561,7 @@ class ContentEnhancer:
         
         return bullets
 
+    @_skip_if_trivial()
     def enhance_summary(self, raw_summary: str, analysis: Dict = None) -> str:
         """
         Transform raw summary into professional format while preserving user's actual content
@@ -284,15 +572,12 @@ class ContentEnhancer:
         - Keyword-rich but natural
         - Recruiter-written quality
         """
-        if not raw_summary or not raw_summary.strip():
-            return ""
-        
         # Clean up the raw summary
         cleaned_summary = raw_summary.strip()
         
         # Apply basic professional formatting
         # Ensure proper capitalization
-        sentences = re.split(r'[.!?]+', cleaned_summary)
+        sentences = self._SUMMARY_SPLIT_RE.split(cleaned_summary)
         formatted_sentences = []
         
         for sentence in sentences:
@@ -315,25 +600,8 @@ class ContentEnhancer:
     
     def _detect_domain(self, text: str, analysis: Dict) -> str:
         """Detect the professional domain from text"""
-        text_lower = text.lower()
-        keywords = analysis.get("keywords", [])
-        
-        # Software engineering indicators
-        software_terms = ['software', 'developer', 'engineer', 'programming', 'code', 'api', 'web', 'app']
-        if any(term in text_lower for term in software_terms):
-            return 'software'
-        
-        # Data science indicators
-        data_terms = ['data', 'analytics', 'machine learning', 'statistics', 'analysis', 'visualization']
-        if any(term in text_lower for term in data_terms):
-            return 'data'
-        
-        # Business indicators
-        business_terms = ['business', 'management', 'strategy', 'operations', 'marketing', 'sales']
-        if any(term in text_lower for term in business_terms):
-            return 'business'
-        
-        return 'software'  # Default
+        # Domain with the most indicator hits in a single scan
+        return _DOMAIN_TERMS.best(text.lower()) or 'software'  # Default
     
     def _extract_key_skills(self, text: str, analysis: Dict) -> List[str]:
         """Extract key technical skills"""
@@ -348,26 +616,16 @@ class ContentEnhancer:
         
         # Fallback: extract from text directly
         if not technical_skills:
-            text_lower = text.lower()
-            common_skills = ['python', 'javascript', 'react', 'node.js', 'aws', 'docker', 'sql']
-            for skill in common_skills:
-                if skill in text_lower:
-                    technical_skills.append(skill.title())
+            found = _COMMON_SKILLS.labels(text.lower())
+            technical_skills = [skill.title() for skill in COMMON_SKILLS if skill in found]
         
         return technical_skills[:5]  # Limit to top 5
     
     def _extract_years_experience(self, text: str) -> str:
         """Extract years of experience from text"""
         # Look for patterns like "5 years", "3+ years", etc.
-        patterns = [
-            r'(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?',
-            r'over\s+(\d+)\s*years?',
-            r'more than\s+(\d+)\s*years?'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._YEARS_RES:
+            match = pattern.search(text)
             if match:
                 years = match.group(1)
                 return f"{years}+"
@@ -380,23 +638,20 @@ class ContentEnhancer:
             return self.nlp_engine.extract_quantified_achievements(text)
         
         # Basic achievement extraction
-        achievement_indicators = ['improved', 'increased', 'reduced', 'achieved', 'delivered', 'led']
-        sentences = re.split(r'[.!?]', text)
+        sentences = self._ACHIEVEMENT_SPLIT_RE.split(text)
         
         achievements = []
         for sentence in sentences:
-            if any(indicator in sentence.lower() for indicator in achievement_indicators):
+            if _ACHIEVEMENT_TERMS.matches(sentence.lower()):
                 achievements.append(sentence.strip())
         
         return achievements
 
+    @_skip_if_trivial()
     def enhance_skills(self, raw_skills: str, analysis: Dict = None) -> str:
         """
         Transform raw skills into categorized, keyword-rich format
         """
-        if not raw_skills or not raw_skills.strip():
-            return ""
-        
         # Parse skills from text
         skills = self._parse_skills(raw_skills)
         
@@ -416,7 +671,7 @@ class ContentEnhancer:
     def _parse_skills(self, raw_skills: str) -> List[str]:
         """Parse skills from raw text"""
         # Split by common delimiters
-        skills = re.split(r'[,;|\n]', raw_skills)
+        skills = raw_skills.translate(self._SKILL_TRANS).split(',')
         
         # Clean and filter skills
         cleaned_skills = []
@@ -429,46 +684,18 @@ class ContentEnhancer:
     
     def _categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
         """Categorize skills for better ATS parsing"""
-        categories = {
-            "Programming Languages": [],
-            "Frameworks & Libraries": [],
-            "Databases": [],
-            "Cloud & DevOps": [],
-            "Tools & Platforms": []
-        }
-        
-        # Categorization mappings
-        programming_langs = ['python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go', 'typescript']
-        frameworks = ['react', 'angular', 'vue', 'node.js', 'django', 'flask', 'spring', 'express']
-        databases = ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite']
-        cloud_devops = ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform']
-        tools = ['git', 'github', 'jira', 'postman', 'figma', 'photoshop']
-        
+        categorized = defaultdict(list)
         for skill in skills:
-            skill_lower = skill.lower()
-            
-            if any(lang in skill_lower for lang in programming_langs):
-                categories["Programming Languages"].append(skill)
-            elif any(fw in skill_lower for fw in frameworks):
-                categories["Frameworks & Libraries"].append(skill)
-            elif any(db in skill_lower for db in databases):
-                categories["Databases"].append(skill)
-            elif any(cd in skill_lower for cd in cloud_devops):
-                categories["Cloud & DevOps"].append(skill)
-            elif any(tool in skill_lower for tool in tools):
-                categories["Tools & Platforms"].append(skill)
-            else:
-                # Default to Tools & Platforms
-                categories["Tools & Platforms"].append(skill)
+            # Default to Tools & Platforms
+            category = _SKILL_CATEGORIES.first(skill.lower()) or "Tools & Platforms"
+            categorized[category].append(skill)
         
-        # Remove empty categories
-        return {k: v for k, v in categories.items() if v}
+        # Only non-empty categories, in display order
+        return {category: categorized[category] for category in _SKILL_CATEGORIES.groups if category in categorized}
 
+    @_skip_if_trivial()
     def enhance_education(self, raw_education: str, analysis: Dict = None) -> str:
         """Enhance education entries with proper formatting"""
-        if not raw_education or not raw_education.strip():
-            return ""
-        
         # Clean up the education text
         education = raw_education.strip()
         
@@ -478,28 +705,14 @@ class ContentEnhancer:
         
         return education
 
+    @_skip_if_trivial(MIN_MEANINGFUL)
     def enhance_projects(self, raw_projects: str, analysis: Dict = None) -> str:
         """Transform project descriptions into professional format"""
-        if not raw_projects or not raw_projects.strip():
-            return ""
-        
-        # Analyze the text
-        if self.nlp_engine:
-            analysis = self.nlp_engine.analyze_text(raw_projects)
-        else:
-            analysis = {"sentences": [raw_projects]}
-        
-        # Transform each sentence
-        sentences = analysis.get("sentences", [raw_projects])
-        enhanced_sentences = []
-        
-        for sentence in sentences:
-            if sentence.strip():
-                enhanced = self._transform_to_bullet(sentence, analysis)
-                if enhanced:
-                    enhanced_sentences.append(enhanced)
-        
-        result = '\n'.join(enhanced_sentences)
+        # Transform each sentence as it is produced
+        sentences = self._iter_sentences(raw_projects, analysis)
+        analysis = analysis or {}
+        enhanced = (self._transform_to_bullet(sentence, analysis) for sentence in sentences if sentence.strip())
+        result = '\n'.join(bullet for bullet in enhanced if bullet)
         
         # Apply AI polishing if available
         if self.openai_client and result:
@@ -545,28 +758,43 @@ class ContentEnhancer:
         if len(text.strip()) < 50:
             return text
         
-        # Validate token count (rough estimate: 1 token ≈ 4 characters)
-        estimated_tokens = len(text) // 4
-        if estimated_tokens > 400:  # Leave room for response
+        estimated_tokens = count_tokens(text, os.environ.get('OPENAI_MODEL', 'gpt-4o-mini'))
+        if estimated_tokens > self._POLISH_MAX_TOKENS:
+            chunks = self._split_for_polish(text)
+            if len(chunks) > 1:
+                separator = '\n' if '\n' in text else ' '
+                polished_chunks = [self.ai_polish(chunk, content_type) for chunk in chunks]
+                # Inside deferred_polish() the chunks were only recorded
+                if self._pending_polish is not None:
+                    return text
+                return separator.join(polished_chunks)
             logger.warning(f"Text too long for polishing ({estimated_tokens} tokens), skipping AI polish")
             return text
         
+        key = (content_type, text)
+        
+        # Inside deferred_polish(): record the text and polish it later in one batch
+        if self._pending_polish is not None:
+            if key not in self._polish_cache:
+                self._pending_polish[key] = None
+            return text
+        
+        cached = self._polish_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # The last batch on this thread already failed for this text; don't retry it alone
+        if key in self._polish_failed:
+            return text
+        
         try:
-            # Create content-specific prompts
-            prompts = {
-                'summary': "Polish this professional summary for clarity and impact. Keep it 2-3 sentences, maintain all technical details, and ensure it sounds natural and engaging:",
-                'experience': "Polish these experience bullet points for clarity and professional tone. Maintain all technical details, metrics, and action verbs. Keep the bullet point format:",
-                'projects': "Polish these project descriptions for clarity and impact. Maintain all technical details and keep the professional tone:",
-                'general': "Polish this text for clarity and professional tone while maintaining all technical details:"
-            }
-            
-            prompt = prompts.get(content_type, prompts['general'])
+            prompt = self._POLISH_PROMPTS.get(content_type, self._POLISH_PROMPTS['general'])
             
             # Make API call with minimal token usage
             response = self.openai_client.chat.completions.create(
                 model=os.environ.get('OPENAI_MODEL', 'gpt-4o-mini'),
                 messages=[
-                    {"role": "system", "content": "You are a professional resume writer. Polish the provided text while maintaining all technical details, metrics, and professional formatting."},
+                    {"role": "system", "content": self._POLISH_SYSTEM_PROMPT},
                     {"role": "user", "content": f"{prompt}\n\n{text}"}
                 ],
                 max_tokens=500,
@@ -578,6 +806,7 @@ class ContentEnhancer:
             # Validate the response
             if polished_text and len(polished_text) > 10:
                 logger.info(f"Successfully polished {content_type} content ({len(text)} -> {len(polished_text)} chars)")
+                self._remember_polish(key, polished_text)
                 return polished_text
             else:
                 logger.warning("AI polishing returned empty/invalid response, using original text")
@@ -587,35 +816,176 @@ class ContentEnhancer:
             logger.warning(f"AI polishing failed: {e}, using original text")
             return text
 
-    def enhance_experience_with_ai(self, raw_experience: str, analysis: Dict = None) -> str:
-        """Enhanced experience processing with optional AI polishing"""
-        # First, apply local NLP enhancement
-        enhanced_text = self.enhance_experience(raw_experience, analysis)
+    def _split_for_polish(self, text: str) -> List[str]:
+        """Pack lines (or sentences) of text into chunks that each fit one polish request"""
+        if '\n' in text:
+            units, separator = text.split('\n'), '\n'
+        else:
+            units, separator = self._SENTENCE_BOUNDARY_RE.split(text), ' '
+        
+        model = os.environ.get('OPENAI_MODEL', 'gpt-4o-mini')
+        chunks = []
+        current = []
+        current_tokens = 0
+        for unit in units:
+            unit_tokens = count_tokens(unit, model) + 1  # Allow for the separator
+            if current and current_tokens + unit_tokens > self._POLISH_MAX_TOKENS:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            current.append(unit)
+            current_tokens += unit_tokens
+        if current:
+            chunks.append(separator.join(current))
+        
+        return chunks
+
+    @contextmanager
+    def deferred_polish(self):
+        """
+        Collect ai_polish requests instead of sending them, then polish them in one batch
+        
+        Inside the block ai_polish returns its input unchanged. On exit every
+        collected text is polished with a single polish_batch call, so a later
+        pass over the same content is served from the polish cache. Texts the
+        batch did not polish are not cached; until the next deferred_polish()
+        on this thread ai_polish returns them unchanged instead of retrying.
+        """
+        if not self.openai_client or self._pending_polish is not None:
+            yield
+            return
+        
+        self._polish_failed = frozenset()
+        self._pending_polish = {}
+        try:
+            yield
+            pending = list(self._pending_polish)
+        finally:
+            self._pending_polish = None
+        
+        if not pending:
+            return
         
-        # Then apply AI polishing if available
-        if self.openai_client and enhanced_text:
-            enhanced_text = self.ai_polish(enhanced_text, 'experience')
+        sections = {f"{content_type}_{index}": text for index, (content_type, text) in enumerate(pending)}
+        if os.environ.get('OPENAI_POLISH_MODE') == 'concurrent':
+            polished = asyncio.run(self.enhance_all_async(sections))
+        else:
+            polished = self.polish_batch(sections)
+        # Failure paths hand back the original text, so only cache real changes
+        failed = set()
+        for name, key in zip(sections, pending):
+            polished_text = polished.get(name)
+            if polished_text and polished_text != key[1]:
+                self._remember_polish(key, polished_text)
+            else:
+                failed.add(key)
+        if failed:
+            logger.warning(f"Batched AI polishing left {len(failed)} of {len(pending)} texts unpolished")
+        self._polish_failed = frozenset(failed)
+
+    def polish_batch(self, sections: Dict[str, str]) -> Dict[str, str]:
+        """
+        Polish several texts with a single OpenAI request
+        
+        Args:
+            sections: Mapping of section name to text. The content type is taken
+                from the name prefix ('summary_0', 'experience_3', ...)
+        
+        Returns:
+            Mapping of section name to polished text; original text for any
+            section the API did not return or on failure
+        """
+        if not self.openai_client or not sections:
+            return dict(sections)
+        
+        instructions = '\n'.join(
+            f"- {name}: {self._POLISH_PROMPTS.get(name.rsplit('_', 1)[0], self._POLISH_PROMPTS['general'])}"
+            for name in sections
+        )
+        
+        try:
+            response = self.openai_client.chat.completions.create(
+                model=os.environ.get('OPENAI_MODEL', 'gpt-4o-mini'),
+                messages=[
+                    {"role": "system", "content": self._POLISH_SYSTEM_PROMPT + " Return a JSON object mapping each section name to its polished text."},
+                    {"role": "user", "content": f"Instructions per section:\n{instructions}\n\nSections:\n{json.dumps(sections)}"}
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=min(500 * len(sections), 4000),
+                temperature=0.3  # Lower temperature for more consistent, professional output
+            )
+            
+            returned = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.warning(f"Batched AI polishing failed: {e}, using original text")
+            return dict(sections)
+        
+        polished = {}
+        for name, text in sections.items():
+            candidate = returned.get(name) if isinstance(returned, dict) else None
+            if isinstance(candidate, str) and len(candidate.strip()) > 10:
+                polished[name] = candidate.strip()
+            else:
+                polished[name] = text
         
-        return enhanced_text
+        logger.info(f"Polished {len(sections)} sections in one request")
+        return polished
 
-    def enhance_summary_with_ai(self, raw_summary: str, analysis: Dict = None) -> str:
-        """Enhanced summary processing with optional AI polishing"""
-        # First, apply local NLP enhancement
-        enhanced_text = self.enhance_summary(raw_summary, analysis)
+    async def _polish_async(self, client, semaphore, text: str, content_type: str) -> str:
+        """Polish one text on the async client; returns the original text on failure"""
+        prompt = self._POLISH_PROMPTS.get(content_type, self._POLISH_PROMPTS['general'])
+        try:
+            async with semaphore:
+                response = await client.chat.completions.create(
+                    model=os.environ.get('OPENAI_MODEL', 'gpt-4o-mini'),
+                    messages=[
+                        {"role": "system", "content": self._POLISH_SYSTEM_PROMPT},
+                        {"role": "user", "content": f"{prompt}\n\n{text}"}
+                    ],
+                    max_tokens=500,
+                    temperature=0.3
+                )
+            polished_text = response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.warning(f"AI polishing failed: {e}, using original text")
+            return text
         
-        # Then apply AI polishing if available
-        if self.openai_client and enhanced_text:
-            enhanced_text = self.ai_polish(enhanced_text, 'summary')
+        return polished_text if polished_text and len(polished_text) > 10 else text
+
+    async def enhance_all_async(self, sections: Dict[str, str]) -> Dict[str, str]:
+        """
+        Polish sections independently with bounded concurrency
+        
+        Takes and returns the same mapping as polish_batch, but sends one
+        request per section so wall-clock time is the slowest section rather
+        than the sum. Use asyncio.run() from synchronous code.
+        """
+        if not self.openai_client or not OPENAI_AVAILABLE or not sections:
+            return dict(sections)
         
-        return enhanced_text
+        # The async client is bound to the running event loop, so it is created per call
+        client = AsyncOpenAI(api_key=os.environ.get('OPENAI_API_KEY'), max_retries=self._POLISH_MAX_RETRIES)
+        semaphore = asyncio.Semaphore(self._POLISH_CONCURRENCY)
+        try:
+            results = await asyncio.gather(*(
+                self._polish_async(client, semaphore, text, name.rsplit('_', 1)[0])
+                for name, text in sections.items()
+            ))
+        finally:
+            await client.close()
+        
+        return dict(zip(sections, results))
+
+    # The base enhance_* methods already apply AI polishing when a client is
+    # configured; these names are kept for callers that ask for it explicitly.
+
+    def enhance_experience_with_ai(self, raw_experience: str, analysis: Dict = None) -> str:
+        """Enhanced experience processing with optional AI polishing"""
+        return self.enhance_experience(raw_experience, analysis)
+
+    def enhance_summary_with_ai(self, raw_summary: str, analysis: Dict = None) -> str:
+        """Enhanced summary processing with optional AI polishing"""
+        return self.enhance_summary(raw_summary, analysis)
 
     def enhance_projects_with_ai(self, raw_projects: str, analysis: Dict = None) -> str:
         """Enhanced projects processing with optional AI polishing"""
-        # First, apply local NLP enhancement
-        enhanced_text = self.enhance_projects(raw_projects, analysis)
-        
-        # Then apply AI polishing if available
-        if self.openai_client and enhanced_text:
-            enhanced_text = self.ai_polish(enhanced_text, 'projects')
-        
-        return enhanced_text
\ No newline at end of file
+        return self.enhance_projects(raw_projects, analysis)
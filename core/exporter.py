@@ -16,6 +16,7 @@ FORMATTING: Minimal styling to ensure ATS readability
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.shared import OxmlElement, qn
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
@@ -25,9 +26,48 @@ from reportlab.lib.colors import black
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 import logging
 import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Known section headers (exact, lowercased)
+_SECTION_HEADERS = frozenset([
+    'professional summary', 'professional objective', 'technical skills',
+    'professional experience', 'education', 'projects', 'skills',
+    'experience', 'summary', 'objective', 'certifications', 'awards',
+    'languages', 'volunteer experience', 'publications', 'achievements'
+])
+
+# Any of these in a (lowercased) line marks it as contact information
+_CONTACT_RE = re.compile(r'email:|phone:|[@|•]')
+
+# DOCX paragraph styles: name -> (font size, bold, alignment, space before, space after)
+# (lengths are immutable, so they are built once and shared by every document)
+_DOCX_STYLES = {
+    'ATSName': (Pt(16), True, WD_ALIGN_PARAGRAPH.CENTER, None, Pt(6)),
+    'ATSContact': (Pt(11), False, WD_ALIGN_PARAGRAPH.CENTER, None, Pt(12)),
+    'ATSSection': (Pt(12), True, None, Pt(12), Pt(3)),
+    'ATSSeparator': (Pt(10), False, None, None, Pt(6)),
+    'ATSBullet': (Pt(11), False, None, None, Pt(3)),
+    'ATSBody': (Pt(11), False, None, None, Pt(6)),
+}
+
+# ATS-friendly page margins
+_MARGIN_VERTICAL = Inches(0.5)
+_MARGIN_HORIZONTAL = Inches(0.75)
+
+_SUB_BULLET_PREFIXES = ('  •', '    •')
+_BULLET_PREFIXES = ('•', '- ')
+
+# One match per line, same lines as str.split('\n') (including a trailing empty one)
+_LINE_RE = re.compile(r'^.*$', re.MULTILINE)
+
+# Three or more separator characters and nothing else
+_SEPARATOR_RE = re.compile(r'[=\-_]{3,}')
+
+# Leading bullet character ("•" or "- ") and the whitespace after it
+_BULLET_MARKER_RE = re.compile(r'^(?:•|- )\s*')
+
 
 def export_to_docx(resume_text: str, output_path: str) -> None:
     """
@@ -46,10 +86,11 @@ def export_to_docx(resume_text: str, output_path: str) -> None:
         # Set ATS-friendly margins (0.5-1 inch recommended)
         _set_document_margins(doc)
         
-        # Process resume content line by line
-        lines = resume_text.split('\n')
+        # Fonts and spacing live on named styles rather than on every run
+        _register_styles(doc)
         
-        for i, line in enumerate(lines):
+        # Process resume content line by line
+        for i, line in enumerate(_iter_lines(resume_text)):
             line = line.strip()
             
             if not line:
@@ -58,22 +99,8 @@ def export_to_docx(resume_text: str, output_path: str) -> None:
                 continue
             
             # Determine line type and format accordingly
-            line_type = _classify_line(line, i, lines)
-            
-            if line_type == 'name_header':
-                _add_name_header(doc, line)
-            elif line_type == 'contact_info':
-                _add_contact_info(doc, line)
-            elif line_type == 'section_header':
-                _add_section_header(doc, line)
-            elif line_type == 'separator':
-                _add_separator(doc, line)
-            elif line_type == 'bullet_point':
-                _add_bullet_point(doc, line)
-            elif line_type == 'sub_bullet':
-                _add_sub_bullet_point(doc, line)
-            else:
-                _add_body_text(doc, line)
+            line_type = _classify_line(line, i)
+            _DOCX_WRITERS.get(line_type, _add_body_text)(doc, line)
         
         # Save document
         doc.save(output_path)
@@ -106,14 +133,13 @@ def export_to_pdf(resume_text: str, output_path: str) -> None:
             bottomMargin=0.5*inch
         )
         
-        # Create ATS-optimized styles
-        styles = _create_pdf_styles()
+        # ATS-optimized styles, built once at import
+        styles = _PDF_STYLES
         
         # Build PDF content
         story = []
-        lines = resume_text.split('\n')
         
-        for i, line in enumerate(lines):
+        for i, line in enumerate(_iter_lines(resume_text)):
             line = line.strip()
             
             if not line:
@@ -121,7 +147,7 @@ def export_to_pdf(resume_text: str, output_path: str) -> None:
                 continue
             
             # Classify and format line
-            line_type = _classify_line(line, i, lines)
+            line_type = _classify_line(line, i)
             
             if line_type == 'name_header':
                 story.append(Paragraph(line, styles['NameHeader']))
@@ -134,10 +160,10 @@ def export_to_pdf(resume_text: str, output_path: str) -> None:
                 # Skip separators in PDF (handled by spacing)
                 continue
             elif line_type == 'bullet_point':
-                bullet_text = _clean_bullet_text(line)
+                bullet_text = _BULLET_MARKER_RE.sub('', line, count=1)
                 story.append(Paragraph(f"• {bullet_text}", styles['BulletPoint']))
             elif line_type == 'sub_bullet':
-                bullet_text = _clean_bullet_text(line)
+                bullet_text = _BULLET_MARKER_RE.sub('', line, count=1)
                 story.append(Paragraph(f"    • {bullet_text}", styles['SubBulletPoint']))
             else:
                 story.append(Paragraph(line, styles['BodyText']))
@@ -152,31 +178,39 @@ def export_to_pdf(resume_text: str, output_path: str) -> None:
         _save_as_text_fallback(resume_text, output_path)
 
 
+def _iter_lines(text: str):
+    """Yield the lines of text one at a time instead of building a list"""
+    for match in _LINE_RE.finditer(text):
+        yield match.group()
+
+
 def _set_document_margins(doc: Document) -> None:
     """Set ATS-friendly document margins"""
     sections = doc.sections
     for section in sections:
-        section.top_margin = Inches(0.5)
-        section.bottom_margin = Inches(0.5)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
-
-
-def _classify_line(line: str, index: int, all_lines: list) -> str:
-    """Classify line type for appropriate formatting"""
-    line_lower = line.lower().strip()
+        section.top_margin = _MARGIN_VERTICAL
+        section.bottom_margin = _MARGIN_VERTICAL
+        section.left_margin = _MARGIN_HORIZONTAL
+        section.right_margin = _MARGIN_HORIZONTAL
+
+
+def _classify_line(line: str, index: int) -> str:
+    """Classify an already-stripped line for appropriate formatting"""
+    # Lowercase and case-check once; every test below reuses them
+    line_lower = line.lower()
+    is_upper = line.isupper()
+    is_header = _is_section_header(line, line_lower, is_upper)
     
     # Name header (first significant line, all caps, not a section)
-    if index <= 2 and line.isupper() and not _is_section_header(line):
+    if index <= 2 and is_upper and not is_header:
         return 'name_header'
     
     # Contact information
-    if any(indicator in line_lower for indicator in ['email:', 'phone:', '@', '|', '•']):
-        if not line.startswith('•'):  # Not a bullet point
-            return 'contact_info'
+    if not line.startswith('•') and _CONTACT_RE.search(line_lower):  # Not a bullet point
+        return 'contact_info'
     
     # Section headers
-    if _is_section_header(line):
+    if is_header:
         return 'section_header'
     
     # Separator lines
@@ -184,136 +218,111 @@ def _classify_line(line: str, index: int, all_lines: list) -> str:
         return 'separator'
     
     # Sub-bullet points (indented)
-    if line.startswith('  •') or line.startswith('    •'):
+    if line.startswith(_SUB_BULLET_PREFIXES):
         return 'sub_bullet'
     
     # Regular bullet points
-    if line.startswith('•') or line.startswith('- '):
+    if line.startswith(_BULLET_PREFIXES):
         return 'bullet_point'
     
     # Default to body text
     return 'body_text'
 
 
-def _is_section_header(line: str) -> bool:
+def _is_section_header(line: str, line_lower: str = None, is_upper: bool = None) -> bool:
     """Check if line is a section header"""
-    line_lower = line.lower().strip()
-    
-    # Known section headers
-    section_headers = [
-        'professional summary', 'professional objective', 'technical skills',
-        'professional experience', 'education', 'projects', 'skills',
-        'experience', 'summary', 'objective', 'certifications', 'awards',
-        'languages', 'volunteer experience', 'publications', 'achievements'
-    ]
+    if line_lower is None:
+        line_lower = line.lower().strip()
+    if is_upper is None:
+        is_upper = line.isupper()
     
     # Exact match or all caps short phrase
-    return (line_lower in section_headers or 
-            (line.isupper() and len(line.split()) <= 4 and len(line) > 3))
+    return (line_lower in _SECTION_HEADERS or
+            (is_upper and len(line) > 3 and len(line.split()) <= 4))
 
 
 def _is_separator_line(line: str) -> bool:
     """Check if line is a separator"""
-    return (len(line) > 2 and 
-            all(c in '=-_' for c in line.strip()) and 
-            len(set(line.strip())) <= 2)
+    stripped = line.strip()
+    return (_SEPARATOR_RE.fullmatch(stripped) is not None and
+            len(set(stripped)) <= 2)
+
+
+def _register_styles(doc: Document) -> None:
+    """Register the ATS paragraph styles so lines only reference a style name"""
+    styles = doc.styles
+    for name, (size, bold, alignment, space_before, space_after) in _DOCX_STYLES.items():
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = styles['Normal']
+        style.font.name = 'Calibri'
+        style.font.size = size
+        style.font.bold = bold
+        paragraph_format = style.paragraph_format
+        if alignment is not None:
+            paragraph_format.alignment = alignment
+        if space_before is not None:
+            paragraph_format.space_before = space_before
+        paragraph_format.space_after = space_after
 
 
 def _add_name_header(doc: Document, text: str) -> None:
     """Add name header with ATS-friendly formatting"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Calibri'
-    run.font.size = Pt(16)
-    run.bold = True
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.space_after = Pt(6)
+    doc.add_paragraph(text, style='ATSName')
 
 
 def _add_contact_info(doc: Document, text: str) -> None:
     """Add contact information"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Calibri'
-    run.font.size = Pt(11)
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.space_after = Pt(12)
+    doc.add_paragraph(text, style='ATSContact')
 
 
 def _add_section_header(doc: Document, text: str) -> None:
     """Add section header with ATS-friendly formatting"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Calibri'
-    run.font.size = Pt(12)
-    run.bold = True
-    p.space_before = Pt(12)
-    p.space_after = Pt(3)
+    doc.add_paragraph(text, style='ATSSection')
 
 
 def _add_separator(doc: Document, text: str) -> None:
     """Add separator line (simplified for ATS)"""
-    p = doc.add_paragraph()
-    run = p.add_run('_' * 30)  # Simplified separator
-    run.font.name = 'Calibri'
-    run.font.size = Pt(10)
-    p.space_after = Pt(6)
+    doc.add_paragraph('_' * 30, style='ATSSeparator')  # Simplified separator
 
 
 def _add_bullet_point(doc: Document, text: str) -> None:
     """Add bullet point with proper formatting"""
     bullet_text = _clean_bullet_text(text)
-    p = doc.add_paragraph()
-    run = p.add_run(f"• {bullet_text}")
-    run.font.name = 'Calibri'
-    run.font.size = Pt(11)
-    p.space_after = Pt(3)
+    doc.add_paragraph(f"• {bullet_text}", style='ATSBullet')
 
 
 def _add_sub_bullet_point(doc: Document, text: str) -> None:
     """Add sub-bullet point with indentation"""
     bullet_text = _clean_bullet_text(text)
-    p = doc.add_paragraph()
-    run = p.add_run(f"    • {bullet_text}")
-    run.font.name = 'Calibri'
-    run.font.size = Pt(11)
-    p.space_after = Pt(3)
+    doc.add_paragraph(f"    • {bullet_text}", style='ATSBullet')
 
 
 def _add_body_text(doc: Document, text: str) -> None:
     """Add regular body text"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Calibri'
-    run.font.size = Pt(11)
-    p.space_after = Pt(6)
+    doc.add_paragraph(text, style='ATSBody')
+
+
+# DOCX writer per line type from _classify_line (anything else is body text)
+_DOCX_WRITERS = {
+    'name_header': _add_name_header,
+    'contact_info': _add_contact_info,
+    'section_header': _add_section_header,
+    'separator': _add_separator,
+    'bullet_point': _add_bullet_point,
+    'sub_bullet': _add_sub_bullet_point,
+}
 
 
 def _add_paragraph(doc: Document, text: str, space_after: int = 6) -> None:
     """Add paragraph with specified spacing"""
-    p = doc.add_paragraph()
-    if text:
-        run = p.add_run(text)
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
-    p.space_after = Pt(space_after)
+    p = doc.add_paragraph(text, style='ATSBody')
+    if space_after != 6:
+        p.paragraph_format.space_after = Pt(space_after)
 
 
 def _clean_bullet_text(line: str) -> str:
     """Clean bullet point text by removing bullet characters"""
-    cleaned = line.strip()
-    
-    # Remove various bullet characters
-    if cleaned.startswith('•'):
-        cleaned = cleaned[1:].strip()
-    elif cleaned.startswith('- '):
-        cleaned = cleaned[2:].strip()
-    elif cleaned.startswith('  •'):
-        cleaned = cleaned[3:].strip()
-    elif cleaned.startswith('    •'):
-        cleaned = cleaned[5:].strip()
-    
-    return cleaned
+    return _BULLET_MARKER_RE.sub('', line.strip(), count=1)
 
 
 def _create_pdf_styles() -> dict:
@@ -381,10 +390,15 @@ def _create_pdf_styles() -> dict:
     return custom_styles
 
 
+# Stylesheet construction is comparatively costly and the styles are only
+# read during export, so every PDF shares one set
+_PDF_STYLES = _create_pdf_styles()
+
+
 def _save_as_text_fallback(resume_text: str, output_path: str) -> None:
     """Save as text file if document export fails"""
     try:
-        text_path = output_path.replace('.docx', '.txt').replace('.pdf', '.txt')
+        text_path = os.path.splitext(output_path)[0] + '.txt'
         with open(text_path, 'w', encoding='utf-8') as f:
             f.write(resume_text)
         logger.info(f"Saved fallback text file: {text_path}")
@@ -11,112 +11,234 @@ FEATURES:
 - Quantified impact detection
 """
 
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Set, Tuple, Iterator
 from collections import Counter
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Optional Aho-Corasick automaton for the skill scan
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _build_automaton(words):
+    """Aho-Corasick automaton reporting each matched word as its value"""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+# Domain-specific keywords for extract_domain_keywords (substring matches)
+DOMAIN_KEYWORDS = {
+    'software': (
+        'agile', 'scrum', 'api', 'microservices', 'architecture', 'scalable',
+        'performance', 'optimization', 'testing', 'debugging', 'deployment',
+        'ci/cd', 'devops', 'cloud', 'security', 'authentication', 'database'
+    ),
+    'data': (
+        'analytics', 'visualization', 'machine learning', 'statistics',
+        'modeling', 'pipeline', 'etl', 'big data', 'insights', 'metrics',
+        'dashboard', 'reporting', 'analysis', 'prediction', 'algorithm'
+    ),
+    'business': (
+        'strategy', 'growth', 'revenue', 'roi', 'kpi', 'stakeholder',
+        'process', 'efficiency', 'optimization', 'leadership', 'team',
+        'project management', 'budget', 'cost reduction', 'market'
+    )
+}
+
+# Comprehensive technical skills database for ATS optimization
+SKILL_KEYWORDS = frozenset({
+    # Programming Languages
+    'python', 'javascript', 'java', 'typescript', 'c++', 'c#', 'php', 'ruby',
+    'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell',
+    
+    # Web Technologies
+    'html', 'css', 'react', 'angular', 'vue.js', 'node.js', 'express',
+    'django', 'flask', 'spring', 'laravel', 'rails', 'asp.net', 'jquery',
+    'bootstrap', 'tailwind', 'sass', 'webpack', 'babel', 'npm', 'yarn',
+    
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+    'oracle', 'sqlite', 'cassandra', 'dynamodb', 'neo4j', 'influxdb',
+    
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab',
+    'terraform', 'ansible', 'chef', 'puppet', 'vagrant', 'nginx', 'apache',
+    
+    # Data Science & ML
+    'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
+    'matplotlib', 'seaborn', 'jupyter', 'spark', 'hadoop', 'tableau',
+    
+    # Tools & Platforms
+    'git', 'github', 'bitbucket', 'jira', 'confluence', 'slack', 'trello',
+    'postman', 'swagger', 'figma', 'sketch', 'photoshop', 'illustrator'
+})
+
+# Strong action verbs for resume optimization
+STRONG_ACTION_VERBS = {
+    'leadership': [
+        'led', 'managed', 'directed', 'supervised', 'coordinated', 'guided',
+        'mentored', 'coached', 'facilitated', 'orchestrated', 'spearheaded',
+        'championed', 'drove', 'initiated', 'established', 'founded'
+    ],
+    'development': [
+        'developed', 'built', 'created', 'designed', 'implemented', 'engineered',
+        'architected', 'programmed', 'coded', 'constructed', 'launched',
+        'deployed', 'delivered', 'produced', 'generated', 'crafted'
+    ],
+    'improvement': [
+        'optimized', 'enhanced', 'improved', 'streamlined', 'upgraded',
+        'modernized', 'refactored', 'automated', 'accelerated', 'strengthened',
+        'transformed', 'revolutionized', 'innovated', 'advanced', 'refined'
+    ],
+    'achievement': [
+        'achieved', 'accomplished', 'delivered', 'exceeded', 'surpassed',
+        'completed', 'executed', 'realized', 'attained', 'secured',
+        'earned', 'won', 'gained', 'obtained', 'reached'
+    ],
+    'analysis': [
+        'analyzed', 'evaluated', 'assessed', 'investigated', 'researched',
+        'examined', 'studied', 'reviewed', 'audited', 'diagnosed',
+        'identified', 'discovered', 'uncovered', 'determined', 'measured'
+    ],
+    'collaboration': [
+        'collaborated', 'partnered', 'cooperated', 'contributed', 'participated',
+        'engaged', 'liaised', 'communicated', 'interfaced', 'coordinated',
+        'synchronized', 'aligned', 'unified', 'integrated', 'facilitated'
+    ]
+}
+
+
+def _index_verbs(groups: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map each verb to its (first) category, so a verb check is one dict lookup"""
+    index = {}
+    for category, verb_list in groups.items():
+        for verb in verb_list:
+            index.setdefault(verb, category)
+    return index
+
+
+_VERB_CATEGORIES = _index_verbs(STRONG_ACTION_VERBS)
+
+# Weak verbs to replace
+WEAK_VERBS = {
+    'worked': 'developed',
+    'helped': 'implemented', 
+    'did': 'executed',
+    'made': 'built',
+    'was responsible for': 'managed',
+    'handled': 'managed',
+    'dealt with': 'resolved',
+    'took care of': 'maintained',
+    'was involved in': 'participated in',
+    'used': 'utilized',
+    'got': 'achieved',
+    'tried': 'attempted',
+    'looked at': 'analyzed',
+    'worked on': 'developed',
+    'worked with': 'collaborated with'
+}
+
+# Stop words to remove during analysis
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'i', 'my', 'me', 'we', 'our', 'us'
+})
+
 
 class NLPEngine:
+    __slots__ = (
+        'nlp', 'skill_keywords', 'strong_action_verbs', '_all_verbs', 'weak_verbs',
+        'stop_words', '_skill_automaton', '_skill_re', '_domain_automata'
+    )
+    
+    # Runs of text between sentence terminators
+    _SENTENCE_RE = re.compile(r'[^.!?]+')
+    
+    # Numbers worth quoting: percentages, "N+", dollar amounts, k/m/b suffixes,
+    # multipliers, ratios, decimals and (comma-grouped) plain numbers
+    _QUANTIFIED_RE = re.compile(
+        r'\$\d+[kmb]?|\d+%|\d+\+|\d+[kmb]|\d+x|\d+:\d+|\d+\.\d+|\d{1,3}(?:,\d{3})*',
+        re.IGNORECASE
+    )
+    
+    # Inflections of common weak verbs (whole words, so "document" is not "do")
+    _WEAK_VERB_PATTERNS = (
+        (re.compile(r'\bwork(?:s|ed|ing)?\b'), 'developed'),
+        (re.compile(r'\bhelp(?:s|ed|ing)?\b'), 'implemented'),
+        (re.compile(r'\b(?:do|does|did|doing|done)\b'), 'executed'),
+        (re.compile(r'\b(?:make|makes|making|made)\b'), 'built'),
+    )
+    
     def __init__(self):
         """Initialize the NLP engine with spaCy model and ATS optimization rules"""
         self.nlp = None
         try:
             import spacy
-            self.nlp = spacy.load("en_core_web_sm")
+            # Entities are never read, so skip the NER component entirely
+            self.nlp = spacy.load("en_core_web_sm", disable=["ner"])
             logger.info("spaCy English model loaded successfully")
         except (OSError, ImportError) as e:
             logger.warning(f"spaCy not available: {e}. Using basic text processing.")
         
-        # Comprehensive technical skills database for ATS optimization
-        self.skill_keywords = {
-            # Programming Languages
-            'python', 'javascript', 'java', 'typescript', 'c++', 'c#', 'php', 'ruby',
-            'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'shell',
-            
-            # Web Technologies
-            'html', 'css', 'react', 'angular', 'vue.js', 'node.js', 'express',
-            'django', 'flask', 'spring', 'laravel', 'rails', 'asp.net', 'jquery',
-            'bootstrap', 'tailwind', 'sass', 'webpack', 'babel', 'npm', 'yarn',
-            
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'oracle', 'sqlite', 'cassandra', 'dynamodb', 'neo4j', 'influxdb',
-            
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab',
-            'terraform', 'ansible', 'chef', 'puppet', 'vagrant', 'nginx', 'apache',
-            
-            # Data Science & ML
-            'pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras',
-            'matplotlib', 'seaborn', 'jupyter', 'spark', 'hadoop', 'tableau',
-            
-            # Tools & Platforms
-            'git', 'github', 'bitbucket', 'jira', 'confluence', 'slack', 'trello',
-            'postman', 'swagger', 'figma', 'sketch', 'photoshop', 'illustrator'
-        }
+        # Shared read-only tables (module constants, not copied per instance)
+        self.skill_keywords = SKILL_KEYWORDS
+        self.strong_action_verbs = STRONG_ACTION_VERBS
+        self._all_verbs = _VERB_CATEGORIES
+        self.weak_verbs = WEAK_VERBS
+        self.stop_words = STOP_WORDS
         
-        # Strong action verbs for resume optimization
-        self.strong_action_verbs = {
-            'leadership': [
-                'led', 'managed', 'directed', 'supervised', 'coordinated', 'guided',
-                'mentored', 'coached', 'facilitated', 'orchestrated', 'spearheaded',
-                'championed', 'drove', 'initiated', 'established', 'founded'
-            ],
-            'development': [
-                'developed', 'built', 'created', 'designed', 'implemented', 'engineered',
-                'architected', 'programmed', 'coded', 'constructed', 'launched',
-                'deployed', 'delivered', 'produced', 'generated', 'crafted'
-            ],
-            'improvement': [
-                'optimized', 'enhanced', 'improved', 'streamlined', 'upgraded',
-                'modernized', 'refactored', 'automated', 'accelerated', 'strengthened',
-                'transformed', 'revolutionized', 'innovated', 'advanced', 'refined'
-            ],
-            'achievement': [
-                'achieved', 'accomplished', 'delivered', 'exceeded', 'surpassed',
-                'completed', 'executed', 'realized', 'attained', 'secured',
-                'earned', 'won', 'gained', 'obtained', 'reached'
-            ],
-            'analysis': [
-                'analyzed', 'evaluated', 'assessed', 'investigated', 'researched',
-                'examined', 'studied', 'reviewed', 'audited', 'diagnosed',
-                'identified', 'discovered', 'uncovered', 'determined', 'measured'
-            ],
-            'collaboration': [
-                'collaborated', 'partnered', 'cooperated', 'contributed', 'participated',
-                'engaged', 'liaised', 'communicated', 'interfaced', 'coordinated',
-                'synchronized', 'aligned', 'unified', 'integrated', 'facilitated'
-            ]
-        }
+        self._build_skill_matcher()
         
-        # Weak verbs to replace
-        self.weak_verbs = {
-            'worked': 'developed',
-            'helped': 'implemented', 
-            'did': 'executed',
-            'made': 'built',
-            'was responsible for': 'managed',
-            'handled': 'managed',
-            'dealt with': 'resolved',
-            'took care of': 'maintained',
-            'was involved in': 'participated in',
-            'used': 'utilized',
-            'got': 'achieved',
-            'tried': 'attempted',
-            'looked at': 'analyzed',
-            'worked on': 'developed',
-            'worked with': 'collaborated with'
-        }
+        # One automaton per domain for extract_domain_keywords (plain scans without pyahocorasick)
+        self._domain_automata = {}
+        if AHOCORASICK_AVAILABLE:
+            self._domain_automata = {
+                domain: _build_automaton(keywords) for domain, keywords in DOMAIN_KEYWORDS.items()
+            }
+
+    def _build_skill_matcher(self):
+        """Compile skill_keywords once into an automaton (or a single regex without pyahocorasick)"""
+        self._skill_automaton = None
+        self._skill_re = None
+        if AHOCORASICK_AVAILABLE:
+            self._skill_automaton = _build_automaton(self.skill_keywords)
+        else:
+            # Longest first so e.g. "c++" is tried before any shorter prefix
+            skills = sorted(self.skill_keywords, key=len, reverse=True)
+            self._skill_re = re.compile(
+                r'(?<![^\W_])(?:' + '|'.join(map(re.escape, skills)) + r')(?![^\W_])'
+            )
+    
+    def find_skills(self, text_lower: str) -> Set[str]:
+        """
+        Return the skill keywords occurring as whole words in lowercased text
         
-        # Stop words to remove during analysis
-        self.stop_words = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'i', 'my', 'me', 'we', 'our', 'us'
-        }
+        A match must not be flanked by letters or digits, so "rust" is not
+        found in "trusted" nor "java" in "javascript".
+        """
+        if self._skill_automaton is None:
+            return set(self._skill_re.findall(text_lower))
+        
+        found = set()
+        last = len(text_lower) - 1
+        for end, skill in self._skill_automaton.iter(text_lower):
+            start = end - len(skill) + 1
+            if start > 0 and text_lower[start - 1].isalnum():
+                continue
+            if end < last and text_lower[end + 1].isalnum():
+                continue
+            found.add(skill)
+        return found
 
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
@@ -138,44 +260,82 @@ class NLPEngine:
         else:
             return self._analyze_basic(text)
     
+    def iter_sentences(self, text: str) -> Iterator[str]:
+        """
+        Yield the cleaned sentences of text one at a time
+        
+        Same sentences as analyze_text()["sentences"], without computing the
+        tokens, keywords and verbs or holding the full list.
+        """
+        if not text or not text.strip():
+            return
+        
+        if self.nlp:
+            sentences = (sent.text.strip() for sent in self.nlp(text).sents)
+        else:
+            sentences = (match.group().strip() for match in self._SENTENCE_RE.finditer(text))
+        
+        for sentence in sentences:
+            if len(sentence) > 10:  # Filter out very short sentences
+                yield sentence
+    
+    def split_sentences(self, texts: List[str], batch_size: int = 32) -> List[List[str]]:
+        """
+        Sentence-split several texts at once, same sentences as iter_sentences() per text
+        
+        With spaCy the non-empty texts share one nlp.pipe run instead of a
+        separate pipeline call each.
+        """
+        if not self.nlp:
+            return [list(self.iter_sentences(text)) for text in texts]
+        
+        results = [[] for _ in texts]
+        pending = [index for index, text in enumerate(texts) if text and text.strip()]
+        docs = self.nlp.pipe((texts[index] for index in pending), batch_size=batch_size)
+        for index, doc in zip(pending, docs):
+            sentences = (sent.text.strip() for sent in doc.sents)
+            results[index] = [sentence for sentence in sentences if len(sentence) > 10]
+        return results
+    
     def _analyze_with_spacy(self, text: str) -> Dict[str, Any]:
         """Advanced analysis using spaCy"""
-        doc = self.nlp(text)
+        return self._analyze_doc(self.nlp(text))
+    
+    def _analyze_doc(self, doc) -> Dict[str, Any]:
+        """Extract tokens, keywords, verbs and sentences from a parsed spaCy Doc"""
+        # Tokens, keywords and verbs are deduplicated as they are collected
+        # (dicts keep first-seen order, unlike the sets used before)
         
         # Extract tokens (lemmatized, no stopwords)
-        tokens = []
+        tokens = {}
         for token in doc:
             if (not token.is_stop and 
                 not token.is_punct and 
                 not token.is_space and
-                len(token.text) > 2 and
-                token.lemma_.lower() not in self.stop_words):
-                tokens.append(token.lemma_.lower())
+                len(token.text) > 2):
+                lemma = token.lemma_.lower()
+                if lemma not in self.stop_words:
+                    tokens[lemma] = None
         
         # Extract keywords (noun phrases + domain terms)
-        keywords = []
+        keywords = {}
         
         # Get noun phrases
         for chunk in doc.noun_chunks:
             if len(chunk.text) > 2:
-                keywords.append(chunk.text.lower())
+                keywords[chunk.text.lower()] = None
         
         # Add technical skills found in text
-        text_lower = text.lower()
-        for skill in self.skill_keywords:
-            if skill in text_lower:
-                keywords.append(skill)
+        keywords.update(dict.fromkeys(self.find_skills(doc.text.lower())))
         
         # Extract action verbs
-        verbs = []
+        verbs = {}
         for token in doc:
             if token.pos_ == "VERB":
                 lemma = token.lemma_.lower()
                 # Check if it's a strong action verb
-                for category, verb_list in self.strong_action_verbs.items():
-                    if lemma in verb_list:
-                        verbs.append(lemma)
-                        break
+                if lemma in self._all_verbs:
+                    verbs[lemma] = None
         
         # Extract and clean sentences
         sentences = []
@@ -185,66 +345,54 @@ class NLPEngine:
                 sentences.append(clean_sent)
         
         return {
-            "tokens": list(set(tokens)),
-            "keywords": list(set(keywords)),
-            "verbs": list(set(verbs)),
+            "tokens": list(tokens),
+            "keywords": list(keywords),
+            "verbs": list(verbs),
             "sentences": sentences
         }
     
     def _analyze_basic(self, text: str) -> Dict[str, Any]:
         """Basic analysis without spaCy"""
         # Basic tokenization
-        words = re.findall(r'\b\w+\b', text.lower())
-        tokens = [word for word in words if word not in self.stop_words and len(word) > 2]
+        text_lower = text.lower()
+        words = re.findall(r'\b\w+\b', text_lower)
+        tokens = dict.fromkeys(word for word in words if word not in self.stop_words and len(word) > 2)
         
         # Extract keywords (technical skills)
-        keywords = []
-        text_lower = text.lower()
-        for skill in self.skill_keywords:
-            if skill in text_lower:
-                keywords.append(skill)
+        keywords = dict.fromkeys(self.find_skills(text_lower))
         
         # Extract verbs (basic pattern matching)
-        verbs = []
-        for word in words:
-            for category, verb_list in self.strong_action_verbs.items():
-                if word in verb_list:
-                    verbs.append(word)
-                    break
+        verbs = dict.fromkeys(word for word in words if word in self._all_verbs)
         
         # Extract sentences
         sentences = [s.strip() for s in re.split(r'[.!?]+', text) if len(s.strip()) > 10]
         
         return {
-            "tokens": list(set(tokens)),
-            "keywords": list(set(keywords)),
-            "verbs": list(set(verbs)),
+            "tokens": list(tokens),
+            "keywords": list(keywords),
+            "verbs": list(verbs),
             "sentences": sentences
         }
     
     def extract_quantified_achievements(self, text: str) -> List[str]:
         """Extract quantified achievements from text"""
-        # Patterns for numbers and percentages
-        number_patterns = [
-            r'\d+%',  # percentages
-            r'\d+\+',  # numbers with plus
-            r'\$\d+[kmb]?',  # dollar amounts
-            r'\d+[kmb]',  # numbers with k/m/b suffix
-            r'\d+x',  # multipliers
-            r'\d+:\d+',  # ratios
-            r'\d+\.\d+',  # decimals
-            r'\d{1,3}(?:,\d{3})*',  # large numbers with commas
-        ]
-        
+        # One pass over the text; windows around nearby numbers are merged
+        # so each stretch of text is reported once
         achievements = []
-        for pattern in number_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Get surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].strip()
-                achievements.append(context)
+        window_start = window_end = None
+        for match in self._QUANTIFIED_RE.finditer(text):
+            # Get surrounding context
+            start = max(0, match.start() - 50)
+            end = min(len(text), match.end() + 50)
+            if window_end is not None and start <= window_end:
+                window_end = max(window_end, end)
+                continue
+            if window_end is not None:
+                achievements.append(text[window_start:window_end].strip())
+            window_start, window_end = start, end
+        
+        if window_end is not None:
+            achievements.append(text[window_start:window_end].strip())
         
         return achievements
     
@@ -256,44 +404,23 @@ class NLPEngine:
         if weak_verb_lower in self.weak_verbs:
             return self.weak_verbs[weak_verb_lower]
         
-        # Pattern matching for common weak patterns
-        if 'work' in weak_verb_lower:
-            return 'developed'
-        elif 'help' in weak_verb_lower:
-            return 'implemented'
-        elif 'do' in weak_verb_lower or 'did' in weak_verb_lower:
-            return 'executed'
-        elif 'make' in weak_verb_lower or 'made' in weak_verb_lower:
-            return 'built'
+        # Pattern matching for common weak patterns, checked in order
+        for pattern, replacement in self._WEAK_VERB_PATTERNS:
+            if pattern.search(weak_verb_lower):
+                return replacement
         
         return weak_verb  # Return original if no replacement found
     
     def extract_domain_keywords(self, text: str, domain: str = 'software') -> List[str]:
         """Extract domain-specific keywords"""
-        domain_keywords = {
-            'software': [
-                'agile', 'scrum', 'api', 'microservices', 'architecture', 'scalable',
-                'performance', 'optimization', 'testing', 'debugging', 'deployment',
-                'ci/cd', 'devops', 'cloud', 'security', 'authentication', 'database'
-            ],
-            'data': [
-                'analytics', 'visualization', 'machine learning', 'statistics',
-                'modeling', 'pipeline', 'etl', 'big data', 'insights', 'metrics',
-                'dashboard', 'reporting', 'analysis', 'prediction', 'algorithm'
-            ],
-            'business': [
-                'strategy', 'growth', 'revenue', 'roi', 'kpi', 'stakeholder',
-                'process', 'efficiency', 'optimization', 'leadership', 'team',
-                'project management', 'budget', 'cost reduction', 'market'
-            ]
-        }
+        if domain not in DOMAIN_KEYWORDS:
+            return []
         
-        keywords = []
         text_lower = text.lower()
+        automaton = self._domain_automata.get(domain)
+        if automaton is None:
+            return [keyword for keyword in DOMAIN_KEYWORDS[domain] if keyword in text_lower]
         
-        if domain in domain_keywords:
-            for keyword in domain_keywords[domain]:
-                if keyword in text_lower:
-                    keywords.append(keyword)
-        
-        return keywords
\ No newline at end of file
+        # One pass over the text, reported in the table's keyword order
+        found = {keyword for _, keyword in automaton.iter(text_lower)}
+        return [keyword for keyword in DOMAIN_KEYWORDS[domain] if keyword in found]
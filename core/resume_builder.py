@@ -26,12 +26,37 @@ SECTION ORDER:
 7. Custom Sections
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
+import threading
+from functools import lru_cache
 from .content_enhancer import ContentEnhancer
 
 logger = logging.getLogger(__name__)
 
+# Horizontal line closing every section
+_SEPARATOR = '-' * 50
+
+# Form fields whose content goes through the content enhancer
+_ENHANCEABLE_FIELDS = (
+    'objective', 'skills', 'education', 'experience', 'projects',
+    'education_entries', 'experience_entries', 'project_entries', 'custom_sections'
+)
+
+# Local (pre-polish) enhancer output keyed by (method, *texts), oldest evicted first (see _enhance)
+_ENHANCE_CACHE: Dict[tuple, str] = {}
+_ENHANCE_CACHE_SIZE = 1024
+_ENHANCE_CACHE_LOCK = threading.Lock()
+
+# (form field, heading) of the sections copied verbatim into the fallback resume
+_FALLBACK_SECTIONS = (
+    ('objective', 'Professional Summary'),
+    ('skills', 'Skills'),
+    ('experience', 'Experience'),
+    ('education', 'Education'),
+    ('projects', 'Projects'),
+)
+
 
 def generate_resume(data: Dict[str, Any], style: str = 'modern') -> str:
     """
@@ -49,96 +74,153 @@ def generate_resume(data: Dict[str, Any], style: str = 'modern') -> str:
     logger.info(f"Generating ATS-optimized resume with style: {style}")
     logger.info(f"Data keys: {list(data.keys())}")
     
-    # Initialize content enhancer for linguistic transformation
+    # Content enhancer for linguistic transformation (created once per process,
+    # and not at all while the data has nothing but header fields)
     enhancer = None
-    try:
-        enhancer = ContentEnhancer()
-        logger.info("Successfully initialized content enhancer for linguistic processing")
-    except Exception as e:
-        logger.warning(f"Content enhancer initialization failed: {e}, using basic processing")
+    if any(data.get(field) for field in _ENHANCEABLE_FIELDS):
+        enhancer = _get_enhancer()
     
-    # Build resume sections with ATS formatting
-    resume_sections = []
+    # Sentence-split every experience/project text in one NLP batch up front;
+    # the section builders then reuse those splits instead of parsing each text
+    analyses = {}
+    if enhancer is not None:
+        try:
+            analyses = enhancer.analyze_batch(_collect_prose_texts(data))
+        except Exception as e:
+            logger.warning(f"Batch analysis failed: {e}, analyzing sections individually")
     
-    # 1. HEADER SECTION (always present)
-    try:
-        header_section = _build_header_section(data)
-        if header_section:
-            resume_sections.append(header_section)
-            logger.info("Added header section")
-    except Exception as e:
-        logger.error(f"Error building header: {e}")
+    # With AI polishing enabled, a first pass only collects the texts to
+    # polish so they go out in one request; the real pass reads the results
+    if enhancer is not None and enhancer.openai_client:
+        with enhancer.deferred_polish():
+            _build_resume_sections(data, enhancer, analyses)
     
-    # 2. PROFESSIONAL SUMMARY
-    try:
-        summary_section = _build_summary_section(data, enhancer)
-        if summary_section:
-            resume_sections.append(summary_section)
-            logger.info("Added professional summary section")
-    except Exception as e:
-        logger.error(f"Error building summary: {e}")
+    # Every polish result is cached by now, so this pass makes no API calls
+    resume_sections = _build_resume_sections(data, enhancer, analyses)
     
-    # 3. TECHNICAL SKILLS
-    try:
-        skills_section = _build_skills_section(data, enhancer)
-        if skills_section:
-            resume_sections.append(skills_section)
-            logger.info("Added technical skills section")
-    except Exception as e:
-        logger.error(f"Error building skills: {e}")
+    # Join all sections with minimal spacing (single blank line between sections)
+    # (stripped once here; the emptiness check and the return reuse it)
+    complete_resume = '\n'.join(resume_sections).strip()
     
-    # 4. EDUCATION
-    try:
-        education_section = _build_education_section(data, enhancer)
-        if education_section:
-            resume_sections.append(education_section)
-            logger.info("Added education section")
-        else:
-            logger.warning("Education section was empty")
-    except Exception as e:
-        logger.error(f"Error building education: {e}")
+    # Ensure we never return empty content
+    if not complete_resume:
+        logger.warning("Generated resume was empty, creating fallback resume")
+        complete_resume = _create_fallback_resume(data).strip()
     
-    # 5. PROFESSIONAL EXPERIENCE
-    try:
-        experience_section = _build_experience_section(data, enhancer)
-        if experience_section:
-            resume_sections.append(experience_section)
-            logger.info("Added professional experience section")
-        else:
-            logger.warning("Experience section was empty")
-    except Exception as e:
-        logger.error(f"Error building experience: {e}")
+    logger.info(f"Successfully generated ATS-optimized resume with {len(resume_sections)} sections, {len(complete_resume)} characters")
+    return complete_resume
+
+
+@lru_cache(maxsize=1)
+def _get_enhancer() -> Optional[ContentEnhancer]:
+    """
+    The process-wide content enhancer, or None if it cannot be created
     
-    # 6. PROJECTS
+    Building one loads the spaCy model and the OpenAI client, so it is done
+    on first use and shared by every later resume.
+    """
     try:
-        projects_section = _build_projects_section(data, enhancer)
-        if projects_section:
-            resume_sections.append(projects_section)
-            logger.info("Added projects section")
-        else:
-            logger.warning("Projects section was empty")
+        enhancer = ContentEnhancer()
+        logger.info("Successfully initialized content enhancer for linguistic processing")
+        return enhancer
     except Exception as e:
-        logger.error(f"Error building projects: {e}")
+        logger.warning(f"Content enhancer initialization failed: {e}, using basic processing")
+        return None
+
+
+def _enhance(enhancer: ContentEnhancer, method: str, *texts: str, analysis: Dict = None) -> str:
+    """
+    Call enhancer.<method>(*texts, analysis), memoizing its local output on the input text
     
-    # 7. CUSTOM SECTIONS
-    try:
-        custom_sections = _build_custom_sections(data, enhancer)
-        resume_sections.extend(custom_sections)
-        if custom_sections:
-            logger.info(f"Added {len(custom_sections)} custom sections")
-    except Exception as e:
-        logger.error(f"Error building custom sections: {e}")
+    Only the shared enhancer is memoized. Its local (pre-polish) output depends
+    on nothing but the text, since the analysis is derived from that same text.
+    With AI polishing on, the local output is what the method returns inside
+    deferred_polish(). Both build passes then share it and only the polish step
+    is re-applied, so the local NLP work runs once per text.
+    """
+    if enhancer is not _get_enhancer():
+        return getattr(enhancer, method)(*texts, analysis)
+    
+    polishing = bool(enhancer.openai_client)
+    key = (method,) + texts
+    local = _ENHANCE_CACHE.get(key)
+    if local is None:
+        # Outside deferred_polish() the method's result is already polished
+        if polishing and not enhancer.polish_deferred:
+            return getattr(enhancer, method)(*texts, analysis)
+        
+        local = getattr(enhancer, method)(*texts, analysis)
+        with _ENHANCE_CACHE_LOCK:
+            if key not in _ENHANCE_CACHE and len(_ENHANCE_CACHE) >= _ENHANCE_CACHE_SIZE:
+                _ENHANCE_CACHE.pop(next(iter(_ENHANCE_CACHE)))
+            _ENHANCE_CACHE[key] = local
     
-    # Join all sections with minimal spacing (single blank line between sections)
-    complete_resume = '\n'.join(resume_sections)
+    return enhancer.polish_enhanced(method, local) if polishing else local
+
+
+def _collect_prose_texts(data: Dict[str, Any]) -> List[str]:
+    """Every text the experience and projects builders will run through the NLP engine"""
+    texts = []
     
-    # Ensure we never return empty content
-    if not complete_resume.strip():
-        logger.warning("Generated resume was empty, creating fallback resume")
-        complete_resume = _create_fallback_resume(data)
+    experience_entries = data.get('experience_entries', [])
+    if not experience_entries and data.get('experience'):
+        texts.append(data['experience'])
+    for entry in experience_entries:
+        for field in ('responsibilities', 'achievements'):
+            if entry.get(field):
+                texts.append(entry[field].strip())
     
-    logger.info(f"Successfully generated ATS-optimized resume with {len(resume_sections)} sections, {len(complete_resume)} characters")
-    return complete_resume.strip()
+    project_entries = data.get('project_entries', [])
+    if not project_entries and data.get('projects'):
+        texts.append(data['projects'])
+    for entry in project_entries:
+        if entry.get('description'):
+            texts.append(entry['description'].strip())
+    
+    return texts
+
+
+def _build_resume_sections(data: Dict[str, Any], enhancer, analyses: Dict[str, Dict] = None) -> List[str]:
+    """Build every resume section in order, skipping any that fail or are empty"""
+    # (name, log label, builder, log when empty), in resume order
+    builders = (
+        ('header', 'header section', lambda: _build_header_section(data), False),
+        ('summary', 'professional summary section', lambda: _build_summary_section(data, enhancer), False),
+        ('skills', 'technical skills section', lambda: _build_skills_section(data, enhancer), False),
+        ('education', 'education section', lambda: _build_education_section(data, enhancer), True),
+        ('experience', 'professional experience section',
+         lambda: _build_experience_section(data, enhancer, analyses), True),
+        ('projects', 'projects section', lambda: _build_projects_section(data, enhancer, analyses), True),
+        ('custom sections', 'custom sections', lambda: _build_custom_sections(data, enhancer), False),
+    )
+    
+    # Build resume sections with ATS formatting
+    resume_sections = []
+    for name, label, build, log_empty in builders:
+        try:
+            section = build()
+        except Exception as e:
+            logger.error(f"Error building {name}: {e}")
+            continue
+        
+        # Custom sections come back as a list of finished sections
+        if isinstance(section, list):
+            resume_sections.extend(section)
+            if section:
+                logger.info(f"Added {len(section)} {label}")
+        elif section:
+            resume_sections.append(section)
+            logger.info(f"Added {label}")
+        elif log_empty:
+            logger.warning(f"{name.capitalize()} section was empty")
+    
+    return resume_sections
+
+
+def _bulletize(text: str) -> List[str]:
+    """One bullet per non-empty line of text, keeping any bullet marker already present"""
+    lines = (line.strip() for line in text.splitlines())
+    return [line if line.startswith('•') else "• " + line for line in lines if line]
 
 
 def _build_header_section(data: Dict[str, Any]) -> str:
@@ -156,23 +238,19 @@ def _build_header_section(data: Dict[str, Any]) -> str:
     # Contact information - Professional format: centered, smaller font
     contact_info = []
     
-    if data.get('location'):
-        contact_info.append(data['location'])
-    
-    if data.get('email'):
-        contact_info.append(data['email'])
-    
-    if data.get('phone'):
-        contact_info.append(data['phone'])
+    for field in ('location', 'email', 'phone'):
+        value = data.get(field)
+        if value:
+            contact_info.append(value)
     
-    if data.get('linkedin'):
-        linkedin_url = data['linkedin']
+    linkedin_url = data.get('linkedin')
+    if linkedin_url:
         if not linkedin_url.startswith('http'):
             linkedin_url = f"https://{linkedin_url}"
         contact_info.append(linkedin_url)
     
-    if data.get('website'):
-        website_url = data['website']
+    website_url = data.get('website')
+    if website_url:
         if not website_url.startswith('http'):
             website_url = f"https://{website_url}"
         contact_info.append(website_url)
@@ -194,7 +272,7 @@ def _build_summary_section(data: Dict[str, Any], enhancer) -> str:
     # Transform using linguistic processing
     if enhancer:
         try:
-            enhanced_summary = enhancer.enhance_summary(objective)
+            enhanced_summary = _enhance(enhancer, 'enhance_summary', objective)
         except Exception as e:
             logger.warning(f"Summary enhancement failed: {e}")
             enhanced_summary = objective
@@ -205,7 +283,7 @@ def _build_summary_section(data: Dict[str, Any], enhancer) -> str:
     section_parts = []
     section_parts.append('Professional Summary')
     section_parts.append(enhanced_summary)
-    section_parts.append('-' * 50)  # Shorter horizontal line
+    section_parts.append(_SEPARATOR)
     
     return '\n'.join(section_parts)
 
@@ -220,7 +298,7 @@ def _build_skills_section(data: Dict[str, Any], enhancer) -> str:
     # Transform using linguistic processing
     if enhancer:
         try:
-            enhanced_skills = enhancer.enhance_skills(skills)
+            enhanced_skills = _enhance(enhancer, 'enhance_skills', skills)
         except Exception as e:
             logger.warning(f"Skills enhancement failed: {e}")
             enhanced_skills = skills
@@ -239,9 +317,9 @@ def _build_skills_section(data: Dict[str, Any], enhancer) -> str:
         # Simple comma-separated skills - convert to bullets
         skill_list = [skill.strip() for skill in enhanced_skills.split(',') if skill.strip()]
         for skill in skill_list:
-            section_parts.append(f'• {skill}')
+            section_parts.append('• ' + skill)
     
-    section_parts.append('-' * 50)  # Shorter horizontal line
+    section_parts.append(_SEPARATOR)
     
     return '\n'.join(section_parts)
 
@@ -254,7 +332,7 @@ def _build_education_section(data: Dict[str, Any], enhancer) -> str:
     if not education_entries and data.get('education'):
         if enhancer:
             try:
-                enhanced_education = enhancer.enhance_education(data['education'])
+                enhanced_education = _enhance(enhancer, 'enhance_education', data['education'])
             except Exception as e:
                 logger.warning(f"Education enhancement failed: {e}")
                 enhanced_education = data['education']
@@ -265,7 +343,7 @@ def _build_education_section(data: Dict[str, Any], enhancer) -> str:
             section_parts = []
             section_parts.append('Education')
             section_parts.append(enhanced_education)
-            section_parts.append('-' * 50)  # Shorter horizontal line
+            section_parts.append(_SEPARATOR)
             return '\n'.join(section_parts)
         return ""
     
@@ -277,7 +355,8 @@ def _build_education_section(data: Dict[str, Any], enhancer) -> str:
     section_parts.append('Education')
     
     for entry in education_entries:
-        if not any([entry.get('institution'), entry.get('degree'), entry.get('field')]):
+        institution, degree, field = entry.get('institution'), entry.get('degree'), entry.get('field')
+        if not (institution or degree or field):
             continue
         
         # Format education entry - Professional style
@@ -285,31 +364,32 @@ def _build_education_section(data: Dict[str, Any], enhancer) -> str:
         
         # Degree and field on first line
         degree_field = []
-        if entry.get('degree'):
-            degree_field.append(entry['degree'])
-        if entry.get('field'):
-            degree_field.append(f"in {entry['field']}")
+        if degree:
+            degree_field.append(degree)
+        if field:
+            degree_field.append(f"in {field}")
         
         if degree_field:
             entry_parts.append(' '.join(degree_field))
         
         # Institution and dates on second line
         institution_info = []
-        if entry.get('institution'):
-            institution_info.append(entry['institution'])
+        if institution:
+            institution_info.append(institution)
         
-        if entry.get('start') and entry.get('end'):
-            institution_info.append(f"| Graduated: {entry['end']}")
-        elif entry.get('end'):
-            institution_info.append(f"| Graduated: {entry['end']}")
+        # Only the end date is shown, whether or not a start date was given
+        end = entry.get('end')
+        if end:
+            institution_info.append(f"| Graduated: {end}")
         
         if institution_info:
             entry_parts.append(' '.join(institution_info))
         
         # Additional info (GPA, achievements)
         additional_info = []
-        if entry.get('gpa'):
-            additional_info.append(f"GPA: {entry['gpa']}")
+        gpa = entry.get('gpa')
+        if gpa:
+            additional_info.append(f"GPA: {gpa}")
         
         if entry.get('achievements'):
             achievements = entry['achievements'].strip()
@@ -330,13 +410,14 @@ def _build_education_section(data: Dict[str, Any], enhancer) -> str:
     
     # Add separator at end of section
     if len(section_parts) > 1:
-        section_parts.append('-' * 50)  # Shorter horizontal line
+        section_parts.append(_SEPARATOR)
     
     return '\n'.join(section_parts) if len(section_parts) > 2 else ""
 
 
-def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
+def _build_experience_section(data: Dict[str, Any], enhancer, analyses: Dict[str, Dict] = None) -> str:
     """Build professional experience section with professional formatting"""
+    analyses = analyses or {}
     experience_entries = data.get('experience_entries', [])
     
     logger.info(f"Building experience section with {len(experience_entries)} entries")
@@ -346,7 +427,7 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
         logger.info("Using legacy experience field")
         if enhancer:
             try:
-                enhanced_experience = enhancer.enhance_experience(data['experience'])
+                enhanced_experience = _enhance(enhancer, 'enhance_experience', data['experience'], analysis=analyses.get(data['experience']))
             except Exception as e:
                 logger.warning(f"Experience enhancement failed: {e}")
                 enhanced_experience = data['experience']
@@ -357,7 +438,7 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
             section_parts = []
             section_parts.append('Experience')
             section_parts.append(enhanced_experience)
-            section_parts.append('-' * 50)  # Shorter horizontal line
+            section_parts.append(_SEPARATOR)
             return '\n'.join(section_parts)
         return ""
     
@@ -372,16 +453,17 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
     for i, entry in enumerate(experience_entries):
         logger.info(f"Processing experience entry {i+1}: {entry}")
         
-        if not any([entry.get('company'), entry.get('title')]):
+        company, title = entry.get('company'), entry.get('title')
+        if not (company or title):
             logger.warning(f"Skipping experience entry {i+1} - no company or title")
             continue
         
         # Job title and company - Professional format
         job_line = []
-        if entry.get('title'):
-            job_line.append(entry['title'])
-        if entry.get('company'):
-            job_line.append(f", {entry['company']}")
+        if title:
+            job_line.append(title)
+        if company:
+            job_line.append(f", {company}")
         
         if job_line:
             job_header = ''.join(job_line)
@@ -389,10 +471,11 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
             logger.info(f"Added job header: {job_header}")
         
         # Dates on separate line
-        if entry.get('start') and entry.get('end'):
-            section_parts.append(f"{entry['start']} - {entry['end']}")
-        elif entry.get('start'):
-            section_parts.append(f"{entry['start']} - Present")
+        start, end = entry.get('start'), entry.get('end')
+        if start and end:
+            section_parts.append(f"{start} - {end}")
+        elif start:
+            section_parts.append(f"{start} - Present")
         
         # Transform responsibilities using linguistic processing
         if entry.get('responsibilities'):
@@ -401,25 +484,16 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
                 logger.info(f"Processing responsibilities: {responsibilities[:100]}...")
                 if enhancer:
                     try:
-                        enhanced_responsibilities = enhancer.enhance_experience(responsibilities)
+                        enhanced_responsibilities = _enhance(enhancer, 'enhance_experience', responsibilities, analysis=analyses.get(responsibilities))
                         # Each line should be a bullet point
-                        for line in enhanced_responsibilities.split('\n'):
-                            if line.strip():
-                                if line.strip().startswith('•'):
-                                    section_parts.append(line.strip())
-                                else:
-                                    section_parts.append(f"• {line.strip()}")
+                        section_parts.extend(_bulletize(enhanced_responsibilities))
                     except Exception as e:
                         logger.warning(f"Responsibility enhancement failed: {e}")
                         # Fallback to original with bullets
-                        for line in responsibilities.split('\n'):
-                            if line.strip():
-                                section_parts.append(f"• {line.strip()}")
+                        section_parts.extend(_bulletize(responsibilities))
                 else:
                     # Basic bullet formatting
-                    for line in responsibilities.split('\n'):
-                        if line.strip():
-                            section_parts.append(f"• {line.strip()}")
+                    section_parts.extend(_bulletize(responsibilities))
                 logger.info("Added responsibilities")
         
         # Transform achievements using linguistic processing
@@ -429,25 +503,16 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
                 logger.info(f"Processing achievements: {achievements[:100]}...")
                 if enhancer:
                     try:
-                        enhanced_achievements = enhancer.enhance_experience(achievements)
+                        enhanced_achievements = _enhance(enhancer, 'enhance_experience', achievements, analysis=analyses.get(achievements))
                         # Each line should be a bullet point
-                        for line in enhanced_achievements.split('\n'):
-                            if line.strip():
-                                if line.strip().startswith('•'):
-                                    section_parts.append(line.strip())
-                                else:
-                                    section_parts.append(f"• {line.strip()}")
+                        section_parts.extend(_bulletize(enhanced_achievements))
                     except Exception as e:
                         logger.warning(f"Achievement enhancement failed: {e}")
                         # Fallback to original with bullets
-                        for line in achievements.split('\n'):
-                            if line.strip():
-                                section_parts.append(f"• {line.strip()}")
+                        section_parts.extend(_bulletize(achievements))
                 else:
                     # Basic bullet formatting
-                    for line in achievements.split('\n'):
-                        if line.strip():
-                            section_parts.append(f"• {line.strip()}")
+                    section_parts.extend(_bulletize(achievements))
                 logger.info("Added achievements")
         
         # Add blank line between entries for professional spacing
@@ -459,15 +524,16 @@ def _build_experience_section(data: Dict[str, Any], enhancer) -> str:
     
     # Add separator at end of section
     if len(section_parts) > 1:
-        section_parts.append('-' * 50)  # Shorter horizontal line
+        section_parts.append(_SEPARATOR)
     
     result = '\n'.join(section_parts) if len(section_parts) > 2 else ""
     logger.info(f"Experience section result length: {len(result)} characters")
     return result
 
 
-def _build_projects_section(data: Dict[str, Any], enhancer) -> str:
+def _build_projects_section(data: Dict[str, Any], enhancer, analyses: Dict[str, Dict] = None) -> str:
     """Build projects section with professional formatting"""
+    analyses = analyses or {}
     project_entries = data.get('project_entries', [])
     
     logger.info(f"Building projects section with {len(project_entries)} entries")
@@ -477,7 +543,7 @@ def _build_projects_section(data: Dict[str, Any], enhancer) -> str:
         logger.info("Using legacy projects field")
         if enhancer:
             try:
-                enhanced_projects = enhancer.enhance_projects(data['projects'])
+                enhanced_projects = _enhance(enhancer, 'enhance_projects', data['projects'], analysis=analyses.get(data['projects']))
             except Exception as e:
                 logger.warning(f"Project enhancement failed: {e}")
                 enhanced_projects = data['projects']
@@ -488,7 +554,7 @@ def _build_projects_section(data: Dict[str, Any], enhancer) -> str:
             section_parts = []
             section_parts.append('Projects')
             section_parts.append(enhanced_projects)
-            section_parts.append('-' * 50)  # Shorter horizontal line
+            section_parts.append(_SEPARATOR)
             return '\n'.join(section_parts)
         return ""
     
@@ -503,17 +569,19 @@ def _build_projects_section(data: Dict[str, Any], enhancer) -> str:
     for i, entry in enumerate(project_entries):
         logger.info(f"Processing project entry {i+1}: {entry}")
         
-        if not any([entry.get('name'), entry.get('description')]):
+        name = entry.get('name')
+        if not (name or entry.get('description')):
             logger.warning(f"Skipping project entry {i+1} - no name or description")
             continue
         
         # Project name and dates - Professional format
-        if entry.get('name'):
-            project_header = entry['name']
+        if name:
+            project_header = name
             
             # Add dates if available (assuming project has start/end dates)
-            if entry.get('start') and entry.get('end'):
-                project_header += f", {entry['start']} - {entry['end']}"
+            start, end = entry.get('start'), entry.get('end')
+            if start and end:
+                project_header += f", {start} - {end}"
             
             section_parts.append(project_header)
             logger.info(f"Added project header: {project_header}")
@@ -525,19 +593,14 @@ def _build_projects_section(data: Dict[str, Any], enhancer) -> str:
                 logger.info(f"Processing project description: {description[:100]}...")
                 if enhancer:
                     try:
-                        enhanced_description = enhancer.enhance_projects(description)
+                        enhanced_description = _enhance(enhancer, 'enhance_projects', description, analysis=analyses.get(description))
                         # Format as bullet points
-                        for line in enhanced_description.split('\n'):
-                            if line.strip():
-                                if line.strip().startswith('•'):
-                                    section_parts.append(line.strip())
-                                else:
-                                    section_parts.append(f"• {line.strip()}")
+                        section_parts.extend(_bulletize(enhanced_description))
                     except Exception as e:
                         logger.warning(f"Project description enhancement failed: {e}")
-                        section_parts.append(f"• {description}")
+                        section_parts.append("• " + description)
                 else:
-                    section_parts.append(f"• {description}")
+                    section_parts.append("• " + description)
                 logger.info("Added description")
         
         # Technologies - Professional format
@@ -560,7 +623,7 @@ def _build_projects_section(data: Dict[str, Any], enhancer) -> str:
     
     # Add separator at end of section
     if len(section_parts) > 1:
-        section_parts.append('-' * 50)  # Shorter horizontal line
+        section_parts.append(_SEPARATOR)
     
     result = '\n'.join(section_parts) if len(section_parts) > 2 else ""
     logger.info(f"Projects section result length: {len(result)} characters")
@@ -586,7 +649,7 @@ def _build_custom_sections(data: Dict[str, Any], enhancer) -> List[str]:
         # Transform content using linguistic processing
         if enhancer:
             try:
-                enhanced_content = enhancer.enhance_custom_section(title, content)
+                enhanced_content = _enhance(enhancer, 'enhance_custom_section', title, content)
             except Exception as e:
                 logger.warning(f"Custom section enhancement failed: {e}")
                 enhanced_content = content
@@ -599,7 +662,7 @@ def _build_custom_sections(data: Dict[str, Any], enhancer) -> List[str]:
             # Professional format: Clean title with content and separator at end
             section_parts.append(title.title())  # Title case instead of uppercase
             section_parts.append(enhanced_content)
-            section_parts.append('-' * 50)  # Shorter horizontal line
+            section_parts.append(_SEPARATOR)
             
             formatted_sections.append('\n'.join(section_parts))
     
@@ -617,46 +680,16 @@ def _create_fallback_resume(data: Dict[str, Any]) -> str:
     fallback_parts.append(name.title())
     
     # Basic contact info
-    contact_info = []
-    if data.get('location'):
-        contact_info.append(data['location'])
-    if data.get('email'):
-        contact_info.append(data['email'])
-    if data.get('phone'):
-        contact_info.append(data['phone'])
+    contact_info = [data[field] for field in ('location', 'email', 'phone') if data.get(field)]
     
     if contact_info:
         fallback_parts.append(' | '.join(contact_info))
         fallback_parts.append("")
     
     # Basic sections with professional formatting
-    if data.get('objective'):
-        fallback_parts.append("Professional Summary")
-        fallback_parts.append(data['objective'])
-        fallback_parts.append("-" * 50)
-        fallback_parts.append("")
-    
-    if data.get('skills'):
-        fallback_parts.append("Skills")
-        fallback_parts.append(data['skills'])
-        fallback_parts.append("-" * 50)
-        fallback_parts.append("")
-    
-    if data.get('experience'):
-        fallback_parts.append("Experience")
-        fallback_parts.append(data['experience'])
-        fallback_parts.append("-" * 50)
-        fallback_parts.append("")
-    
-    if data.get('education'):
-        fallback_parts.append("Education")
-        fallback_parts.append(data['education'])
-        fallback_parts.append("-" * 50)
-        fallback_parts.append("")
-    
-    if data.get('projects'):
-        fallback_parts.append("Projects")
-        fallback_parts.append(data['projects'])
-        fallback_parts.append("-" * 50)
+    for field, heading in _FALLBACK_SECTIONS:
+        content = data.get(field)
+        if content:
+            fallback_parts.extend((heading, content, _SEPARATOR, ""))
     
     return '\n'.join(fallback_parts)
\ No newline at end of file
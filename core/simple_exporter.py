@@ -3,13 +3,46 @@ Simple Resume Exporter - Handles DOCX and PDF export with fallbacks
 """
 
 import os
+import re
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# One match per line, same lines as str.split('\n') without building the list
+_LINE_RE = re.compile(r'^.*$', re.MULTILINE)
+
+# Markers of top-level bullet lines
+_BULLET_MARKERS = ('•', '-', '▸')
+
+# Headings the PDF exporter styles as sections, lowercased once for the per-line check
+_PDF_SECTION_HEADERS = tuple(header.lower() for header in (
+    'Professional Summary', 'Summary', 'Objective',
+    'Skills', 'Technical Skills', 'Core Competencies', 
+    'Education', 'Academic Background',
+    'Experience', 'Professional Experience', 'Work Experience',
+    'Projects', 'Key Projects', 'Notable Projects',
+    'Certifications', 'Certificates', 'Awards',
+    'Achievements', 'Accomplishments'
+))
+
+# Words that mark PDF subsection headers (job titles, education entries, etc.)
+_PDF_SUBSECTION_WORDS = ('university', 'college', 'bachelor', 'master', 'intern', 'engineer', 'developer', 'manager', 'graduated')
+
+# Markers of PDF contact lines
+_PDF_CONTACT_WORDS = ('email', 'phone', 'linkedin', 'location', '@', 'http')
+
+
+def _iter_lines(text):
+    """Yield the lines of text one at a time"""
+    return (match.group() for match in _LINE_RE.finditer(text))
+
 
 def export_to_docx(resume_text, filepath):
-    """Export resume text to DOCX file with multi-page support"""
+    """Export resume text to DOCX with multi-page support
+
+    filepath may be a path or a writable binary stream such as BytesIO.
+    """
     try:
         from docx import Document
         from docx.shared import Inches, Pt, RGBColor
@@ -71,10 +104,21 @@ def export_to_docx(resume_text, filepath):
         except:
             header_style = None
         
-        # Split resume into lines and process
-        lines = resume_text.split('\n')
-        
-        for i, line in enumerate(lines):
+        # Bullet and body spacing live on their styles rather than on every paragraph
+        styles['List Bullet'].paragraph_format.space_after = Pt(3)
+        try:
+            body_style = styles.add_style('ResumeBody', WD_STYLE_TYPE.PARAGRAPH)
+            body_style.base_style = styles['Normal']
+            body_style.paragraph_format.space_after = Pt(6)
+        except:
+            body_style = None
+        
+        # Process resume lines as they are read; only the first one is kept
+        # for the name check
+        first_line = ''
+        for i, line in enumerate(_iter_lines(resume_text)):
+            if i == 0:
+                first_line = line
             line = line.strip()
             
             if not line:
@@ -88,7 +132,7 @@ def export_to_docx(resume_text, filepath):
                     continue  # Skip separator lines
                 
                 # Check if this is the name (first line)
-                if i == 0 or (i == 1 and lines[0].startswith('=')):
+                if i == 0 or (i == 1 and first_line.startswith('=')):
                     # This is the name
                     if name_style:
                         p = doc.add_paragraph(line, style='ResumeName')
@@ -111,11 +155,9 @@ def export_to_docx(resume_text, filepath):
                         p.paragraph_format.space_before = Pt(12)
                         p.paragraph_format.space_after = Pt(6)
                         
-            elif line.startswith('•') or line.startswith('-') or line.startswith('▸'):
+            elif line.startswith(_BULLET_MARKERS):
                 # Add as bullet point
-                bullet_text = line[1:].strip() if line.startswith(('•', '-', '▸')) else line
-                p = doc.add_paragraph(bullet_text, style='List Bullet')
-                p.paragraph_format.space_after = Pt(3)
+                doc.add_paragraph(line[1:].strip(), style='List Bullet')
                 
             elif line.startswith('  •') or line.startswith('  -'):
                 # Sub-bullet point (indented)
@@ -142,25 +184,26 @@ def export_to_docx(resume_text, filepath):
                     # Split long text into smaller chunks
                     words = line.split()
                     chunk_size = 150  # words per paragraph
-                    for j in range(0, len(words), chunk_size):
-                        chunk = ' '.join(words[j:j+chunk_size])
-                        p = doc.add_paragraph(chunk)
-                        p.paragraph_format.space_after = Pt(6)
+                    paragraphs = [' '.join(words[j:j+chunk_size]) for j in range(0, len(words), chunk_size)]
                 else:
-                    p = doc.add_paragraph(line)
-                    p.paragraph_format.space_after = Pt(6)
+                    paragraphs = [line]
+                
+                for text in paragraphs:
+                    if body_style:
+                        doc.add_paragraph(text, style='ResumeBody')
+                    else:
+                        p = doc.add_paragraph(text)
+                        p.paragraph_format.space_after = Pt(6)
         
-        # Ensure directory exists
-        dir_path = os.path.dirname(filepath)
-        if dir_path:
-            os.makedirs(dir_path, exist_ok=True)
+        _ensure_output_dir(filepath)
         
         doc.save(filepath)
         logger.info(f"Successfully created DOCX: {filepath}")
         
         # Verify file was created and has content
-        if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-            logger.info(f"DOCX file size: {os.path.getsize(filepath)} bytes")
+        size = _output_size(filepath)
+        if size > 0:
+            logger.info(f"DOCX file size: {size} bytes")
             return True
         else:
             raise Exception("DOCX file was not created or is empty")
@@ -174,25 +217,22 @@ def export_to_docx(resume_text, filepath):
 
 
 def export_to_pdf(resume_text, filepath):
-    """Export resume text to PDF file with multi-page support"""
+    """Export resume text to PDF with multi-page support
+
+    filepath may be a path or a writable binary stream such as BytesIO.
+    """
     try:
         from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table
         from reportlab.lib.units import inch
-        from reportlab.lib.colors import darkblue, black, Color
-        from reportlab.lib.enums import TA_LEFT, TA_CENTER
         
-        # Define the exact teal/green color from web display
-        teal_color = Color(45/255, 134/255, 89/255)  # #2d8659 converted to RGB
+        # Styles are built on the first export and shared by later ones
+        pdf_styles = _pdf_styles()
         
         logger.info(f"Creating PDF file: {filepath}")
         logger.info(f"Resume text length: {len(resume_text)} characters")
         
-        # Ensure directory exists
-        dir_path = os.path.dirname(filepath)
-        if dir_path:
-            os.makedirs(dir_path, exist_ok=True)
+        _ensure_output_dir(filepath)
         
         # Create PDF document with proper margins for multi-page content
         doc = SimpleDocTemplate(
@@ -204,80 +244,13 @@ def export_to_pdf(resume_text, filepath):
             bottomMargin=0.75*inch
         )
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles for better formatting - matching web display
-        name_style = ParagraphStyle(
-            'ResumeName',
-            parent=styles['Normal'],
-            fontSize=16,  # Match web display (16pt)
-            spaceAfter=4,
-            spaceBefore=0,
-            alignment=TA_CENTER,  # Centered
-            textColor=black,  # Black color like web display
-            fontName='Helvetica-Bold'
-        )
-        
-        contact_style = ParagraphStyle(
-            'ContactInfo',
-            parent=styles['Normal'],
-            fontSize=11,  # Match web display
-            spaceAfter=4,
-            spaceBefore=0,
-            alignment=TA_CENTER,  # Centered like web display
-            textColor=black
-        )
-        
-        header_style = ParagraphStyle(
-            'SectionHeader',
-            parent=styles['Normal'],
-            fontSize=12,  # Match web display (12pt)
-            spaceAfter=4,
-            spaceBefore=16,  # Match web display spacing
-            textColor=teal_color,  # Exact teal/green color like web display
-            fontName='Helvetica-Bold'
-        )
-        
-        body_style = ParagraphStyle(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=11,  # Match web display (11pt)
-            spaceAfter=0,  # Tight spacing like web display
-            spaceBefore=0,
-            leftIndent=0,
-            textColor=black
-        )
-        
-        bullet_style = ParagraphStyle(
-            'BulletText',
-            parent=styles['Normal'],
-            fontSize=11,  # Match web display (11pt)
-            spaceAfter=0,  # Tight spacing like web display
-            spaceBefore=0,
-            leftIndent=20,
-            bulletIndent=10,
-            textColor=black
-        )
-        
-        subsection_style = ParagraphStyle(
-            'SubsectionText',
-            parent=styles['Normal'],
-            fontSize=11,  # Match web display (11pt)
-            spaceAfter=0,
-            spaceBefore=3,  # Small spacing like web display
-            textColor=black,
-            fontName='Helvetica-Bold'  # Bold like web display
-        )
-        
         # Build content with proper page handling
         story = []
-        lines = resume_text.split('\n')
         
         is_first_section = True
         current_section_lines = 0
         
-        for i, line in enumerate(lines):
+        for i, line in enumerate(_iter_lines(resume_text)):
             line = line.strip()
             
             if not line:
@@ -289,36 +262,22 @@ def export_to_pdf(resume_text, filepath):
             if line.startswith('-') and len(set(line)) <= 2:
                 continue
             
-            # Detect section headers (should be teal/green with underline)
-            section_headers = [
-                'Professional Summary', 'Summary', 'Objective',
-                'Skills', 'Technical Skills', 'Core Competencies', 
-                'Education', 'Academic Background',
-                'Experience', 'Professional Experience', 'Work Experience',
-                'Projects', 'Key Projects', 'Notable Projects',
-                'Certifications', 'Certificates', 'Awards',
-                'Achievements', 'Accomplishments'
-            ]
+            # Lowercased once for every keyword check below
+            line_lower = line.lower()
             
-            if any(header.lower() in line.lower() for header in section_headers) and len(line) < 50:
+            # Detect section headers (should be teal/green with underline)
+            if len(line) < 50 and any(header in line_lower for header in _PDF_SECTION_HEADERS):
                 # Section header - add page break if needed for long sections
                 if current_section_lines > 25 and not is_first_section:
                     story.append(PageBreak())
                     current_section_lines = 0
                 
-                # Create section header with simple underline (not a box)
-                from reportlab.platypus import Table, TableStyle
-                from reportlab.lib import colors
-                
                 # Create a simple paragraph with underline effect
-                story.append(Paragraph(line, header_style))
+                story.append(Paragraph(line, pdf_styles['header']))
                 
                 # Add a thin line underneath using a table
                 line_table = Table([[''], ['']], colWidths=[6*inch], rowHeights=[0.01*inch, 0.05*inch])
-                line_table.setStyle(TableStyle([
-                    ('LINEBELOW', (0, 0), (0, 0), 1, teal_color),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ]))
+                line_table.setStyle(pdf_styles['underline'])
                 story.append(line_table)
                 current_section_lines = 0
                 is_first_section = False
@@ -326,47 +285,40 @@ def export_to_pdf(resume_text, filepath):
             elif i == 0 or (line and not any(char in line for char in ['|', '@', 'http']) and len(line.split()) <= 4):
                 # Name (first line or short line without contact info)
                 if i == 0:
-                    story.append(Paragraph(line, name_style))
+                    story.append(Paragraph(line, pdf_styles['name']))
                     current_section_lines = 0
                 else:
                     # Could be a subsection header
-                    story.append(Paragraph(line, subsection_style))
+                    story.append(Paragraph(line, pdf_styles['subsection']))
                     current_section_lines += 1
                     
-            elif '|' in line and any(word in line.lower() for word in ['email', 'phone', 'linkedin', 'location', '@', 'http']):
+            elif '|' in line and any(word in line_lower for word in _PDF_CONTACT_WORDS):
                 # Contact information
-                story.append(Paragraph(line, contact_style))
+                story.append(Paragraph(line, pdf_styles['contact']))
                 current_section_lines += 1
                 
-            elif line.startswith('•') or line.startswith('-') or line.startswith('▸'):
+            elif line.startswith(_BULLET_MARKERS):
                 # Bullet point
-                bullet_text = line[1:].strip() if line.startswith(('•', '-', '▸')) else line
-                story.append(Paragraph(f"• {bullet_text}", bullet_style))
+                story.append(Paragraph(f"• {line[1:].strip()}", pdf_styles['bullet']))
                 current_section_lines += 1
                 
             elif line.startswith('  •') or line.startswith('  -'):
                 # Sub-bullet point (indented)
                 sub_bullet_text = line[3:].strip()
-                sub_bullet_style = ParagraphStyle(
-                    'SubBulletText',
-                    parent=bullet_style,
-                    leftIndent=40,
-                    bulletIndent=30
-                )
-                story.append(Paragraph(f"• {sub_bullet_text}", sub_bullet_style))
+                story.append(Paragraph(f"• {sub_bullet_text}", pdf_styles['sub_bullet']))
                 current_section_lines += 1
                 
             else:
                 # Check if it's a subsection header (job titles, education entries, etc.)
                 if (len(line) < 100 and 
-                    (any(word in line.lower() for word in ['university', 'college', 'bachelor', 'master', 'intern', 'engineer', 'developer', 'manager', 'graduated']) or
+                    (any(word in line_lower for word in _PDF_SUBSECTION_WORDS) or
                      (',' in line and len(line.split(',')) == 2) or  # Job title, Company format
                      (len(line.split()) <= 10 and not line.startswith('•') and not line.startswith('-') and ':' not in line))):
                     # Likely a subsection header
-                    story.append(Paragraph(line, subsection_style))
+                    story.append(Paragraph(line, pdf_styles['subsection']))
                 else:
                     # Regular text
-                    story.append(Paragraph(line, body_style))
+                    story.append(Paragraph(line, pdf_styles['body']))
                 current_section_lines += 1
         
         # Build the PDF with automatic page breaks
@@ -375,8 +327,9 @@ def export_to_pdf(resume_text, filepath):
         logger.info(f"Successfully created PDF: {filepath}")
         
         # Verify file was created and has content
-        if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
-            logger.info(f"PDF file size: {os.path.getsize(filepath)} bytes")
+        size = _output_size(filepath)
+        if size > 0:
+            logger.info(f"PDF file size: {size} bytes")
             return True
         else:
             raise Exception("PDF file was not created or is empty")
@@ -389,11 +342,144 @@ def export_to_pdf(resume_text, filepath):
         return _save_as_text_fallback(resume_text, filepath, 'pdf')
 
 
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """
+    Paragraph styles and header underline for PDF export, matching the web display
+    
+    Built on first use (reportlab is imported lazily) and shared by every later
+    export; reportlab styles are not modified while a document is built.
+    """
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.colors import black, Color
+    from reportlab.lib.enums import TA_CENTER
+    
+    # Define the exact teal/green color from web display
+    teal_color = Color(45/255, 134/255, 89/255)  # #2d8659 converted to RGB
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    
+    # Custom styles for better formatting - matching web display
+    name_style = ParagraphStyle(
+        'ResumeName',
+        parent=styles['Normal'],
+        fontSize=16,  # Match web display (16pt)
+        spaceAfter=4,
+        spaceBefore=0,
+        alignment=TA_CENTER,  # Centered
+        textColor=black,  # Black color like web display
+        fontName='Helvetica-Bold'
+    )
+    
+    contact_style = ParagraphStyle(
+        'ContactInfo',
+        parent=styles['Normal'],
+        fontSize=11,  # Match web display
+        spaceAfter=4,
+        spaceBefore=0,
+        alignment=TA_CENTER,  # Centered like web display
+        textColor=black
+    )
+    
+    header_style = ParagraphStyle(
+        'SectionHeader',
+        parent=styles['Normal'],
+        fontSize=12,  # Match web display (12pt)
+        spaceAfter=4,
+        spaceBefore=16,  # Match web display spacing
+        textColor=teal_color,  # Exact teal/green color like web display
+        fontName='Helvetica-Bold'
+    )
+    
+    body_style = ParagraphStyle(
+        'BodyText',
+        parent=styles['Normal'],
+        fontSize=11,  # Match web display (11pt)
+        spaceAfter=0,  # Tight spacing like web display
+        spaceBefore=0,
+        leftIndent=0,
+        textColor=black
+    )
+    
+    bullet_style = ParagraphStyle(
+        'BulletText',
+        parent=styles['Normal'],
+        fontSize=11,  # Match web display (11pt)
+        spaceAfter=0,  # Tight spacing like web display
+        spaceBefore=0,
+        leftIndent=20,
+        bulletIndent=10,
+        textColor=black
+    )
+    
+    sub_bullet_style = ParagraphStyle(
+        'SubBulletText',
+        parent=bullet_style,
+        leftIndent=40,
+        bulletIndent=30
+    )
+    
+    subsection_style = ParagraphStyle(
+        'SubsectionText',
+        parent=styles['Normal'],
+        fontSize=11,  # Match web display (11pt)
+        spaceAfter=0,
+        spaceBefore=3,  # Small spacing like web display
+        textColor=black,
+        fontName='Helvetica-Bold'  # Bold like web display
+    )
+    
+    # Thin teal line under section headers (a simple underline, not a box)
+    underline_style = TableStyle([
+        ('LINEBELOW', (0, 0), (0, 0), 1, teal_color),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ])
+    
+    return {
+        'name': name_style,
+        'contact': contact_style,
+        'header': header_style,
+        'body': body_style,
+        'bullet': bullet_style,
+        'sub_bullet': sub_bullet_style,
+        'subsection': subsection_style,
+        'underline': underline_style,
+    }
+
+
+def _ensure_output_dir(output):
+    """Create the parent directory of a path output; streams need nothing"""
+    if hasattr(output, 'write'):
+        return
+    dir_path = os.path.dirname(output)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+
+def _output_size(output):
+    """Number of bytes written to a path or stream output"""
+    if hasattr(output, 'write'):
+        return output.tell()
+    if os.path.exists(output):
+        return os.path.getsize(output)
+    return 0
+
+
 def _save_as_text_fallback(resume_text, original_filepath, original_format):
     """Save as text file when DOCX/PDF export fails"""
     try:
+        # Streams get the plain text written in place of the partial document
+        if hasattr(original_filepath, 'write'):
+            original_filepath.seek(0)
+            original_filepath.truncate()
+            original_filepath.write(resume_text.encode('utf-8'))
+            logger.info("Fallback: Wrote plain text to output stream")
+            return True
+        
         # Create text file path
-        text_filepath = original_filepath.replace(f'.{original_format}', '.txt')
+        text_filepath = os.path.splitext(original_filepath)[0] + '.txt'
         
         # Ensure directory exists
         dir_path = os.path.dirname(text_filepath)
@@ -0,0 +1,4 @@
+from flask_caching import Cache
+
+# Created unbound so blueprints can decorate views before the app exists
+cache = Cache()
@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for Resume AI
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Two workers per core plus one (the usual gunicorn sizing), with gevent so IO-bound steps overlap
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gevent'
+worker_connections = 1000
+
+timeout = 120
+accesslog = '-'
+errorlog = '-'
@@ -1,12 +1,33 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import VerifyMismatchError, VerificationError, InvalidHashError
 from datetime import datetime
 import json
 import uuid
 
 db = SQLAlchemy()
 
+# Argon2id with OWASP-recommended parameters (t=2, m=46 MiB, p=1)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=46 * 1024, parallelism=1, type=Type.ID)
+
+
+def verify_password(password_hash, password):
+    """Check a password against a stored Argon2id or legacy Werkzeug hash"""
+    if not password_hash:
+        return False
+    
+    # Legacy Werkzeug pbkdf2/scrypt hashes
+    if not password_hash.startswith('$argon2'):
+        return check_password_hash(password_hash, password)
+    
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerifyMismatchError, VerificationError, InvalidHashError):
+        return False
+
+
 class User(UserMixin, db.Model):
     """User model for authentication"""
     __tablename__ = 'users'
@@ -27,13 +48,56 @@ class User(UserMixin, db.Model):
     def set_password(self, password):
         """Hash and set password"""
         if password:
-            self.password_hash = generate_password_hash(password)
+            self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
         """Check if provided password matches hash"""
+        return verify_password(self.password_hash, password)
+    
+    def insert_if_absent(self, commit=True):
+        """
+        Insert this user with a single INSERT ... ON CONFLICT (email) DO NOTHING
+        
+        Returns False when the email is already registered. The instance is not
+        added to the session; it is only used to carry the inserted values.
+        Pass commit=False to leave the transaction open for the caller.
+        """
+        if not self.id:
+            self.id = str(uuid.uuid4())
+        
+        values = {
+            column.name: getattr(self, column.key)
+            for column in User.__table__.columns
+            if getattr(self, column.key) is not None
+        }
+        
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            # No portable upsert; fall back to check-then-insert
+            if db.session.query(User.query.filter_by(email=self.email).exists()).scalar():
+                return False
+            db.session.execute(User.__table__.insert().values(**values))
+            if commit:
+                db.session.commit()
+            return True
+        
+        stmt = insert(User.__table__).values(**values).on_conflict_do_nothing(index_elements=['email'])
+        result = db.session.execute(stmt)
+        if commit:
+            db.session.commit()
+        return result.rowcount == 1
+    
+    def password_needs_rehash(self):
+        """Check if the stored hash is legacy or uses outdated Argon2 parameters"""
         if not self.password_hash:
             return False
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash.startswith('$argon2'):
+            return True
+        return password_hasher.check_needs_rehash(self.password_hash)
     
     @staticmethod
     def create_from_supabase_user(supabase_user):
@@ -105,4 +169,35 @@ class Resume(db.Model):
         }
     
     def __repr__(self):
-        return f'<Resume {self.title} by User {self.user_id}>'
\ No newline at end of file
+        return f'<Resume {self.title} by User {self.user_id}>'
+
+class ResumeDraft(db.Model):
+    """Server-side storage for the in-progress resume referenced from the session cookie"""
+    __tablename__ = 'resume_drafts'
+    
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    content = db.Column(db.Text, nullable=False)  # Generated resume text
+    style = db.Column(db.String(50), nullable=False, default='modern')
+    form_data = db.Column(db.Text, nullable=False, default='{}')  # JSON string of form data
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)  # Drafts expire after DRAFT_MAX_AGE
+    
+    def set_form_data(self, data):
+        """Store form data as JSON string"""
+        self.form_data = json.dumps(data)
+    
+    def get_form_data(self):
+        """Retrieve form data from JSON string"""
+        try:
+            return json.loads(self.form_data)
+        except (json.JSONDecodeError, TypeError):
+            return {}
+    
+    @staticmethod
+    def delete_older_than(cutoff):
+        """Delete drafts last updated before `cutoff` and return how many were removed"""
+        count = ResumeDraft.query.filter(ResumeDraft.updated_at < cutoff).delete(synchronize_session=False)
+        db.session.commit()
+        return count
+    
+    def __repr__(self):
+        return f'<ResumeDraft {self.id}>'
@@ -7,5 +7,6 @@ if __name__ == "__main__":
     print("📄 Visit http://localhost:5000 in your browser")
     
     # Import and run the main application
-    from app import app
+    from app import app, init_db
+    init_db()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
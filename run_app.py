@@ -3,7 +3,7 @@
 Run the Resume AI app
 """
 
-from app import app
+from app import app, init_db
 
 if __name__ == "__main__":
     print("🚀 Starting Resume AI application...")
@@ -14,4 +14,5 @@ if __name__ == "__main__":
     print("   - Sign Up: http://localhost:5000/auth/signup")
     print()
     
+    init_db()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -49,6 +49,17 @@ def setup_supabase_tables():
         );
         ''',
         
+        # Resume drafts table
+        '''
+        CREATE TABLE IF NOT EXISTS resume_drafts (
+            id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+            content TEXT NOT NULL,
+            style VARCHAR(50) DEFAULT 'modern',
+            form_data TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT NOW()
+        );
+        ''',
+        
         # Indexes
         'CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);',
         'CREATE INDEX IF NOT EXISTS idx_resumes_user_id ON resumes(user_id);',
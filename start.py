@@ -21,10 +21,11 @@ def main():
     
     # Import and run the Flask app
     try:
-        from app import app, cleanup_old_files
+        from app import app, init_db, start_cleanup_scheduler
         
-        # Cleanup old files
-        cleanup_old_files()
+        # Cleanup old files on startup and periodically afterwards
+        start_cleanup_scheduler()
+        init_db()
         
         print("🌐 Starting web server...")
         print("📄 Visit http://localhost:5000 in your browser")
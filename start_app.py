@@ -3,7 +3,7 @@
 Start the Flask app with proper error handling
 """
 
-from app import app
+from app import app, init_db
 import logging
 
 # Set up logging
@@ -20,6 +20,8 @@ if __name__ == "__main__":
         print("   - Landing: http://localhost:5000/")
         print()
         
+        init_db()
+        
         # Test routes before starting
         with app.test_client() as client:
             signin_test = client.get('/auth/signin')
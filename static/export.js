@@ -0,0 +1,22 @@
+// Poll a background export until it is ready and resolve with the file Blob
+// (shared by review.html and edit_resume.html)
+function waitForExport(taskId) {
+    return new Promise((resolve, reject) => {
+        const poll = () => {
+            fetch(`/download_status/${taskId}`)
+            .then(response => {
+                if (response.status === 202) {
+                    setTimeout(poll, 1000);
+                } else if (response.ok) {
+                    response.blob().then(resolve);
+                } else {
+                    response.json().then(data => {
+                        reject(new Error(data.error || 'Download failed'));
+                    });
+                }
+            })
+            .catch(reject);
+        };
+        poll();
+    });
+}
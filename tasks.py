@@ -0,0 +1,47 @@
+"""
+Background export tasks for Resume AI
+
+When CELERY_BROKER_URL is configured, DOCX/PDF exports run on a Celery
+worker instead of inside the web request. Start a worker with:
+    celery -A tasks worker -c 4
+
+The worker writes the export into Config.OUTPUT_DIR and the web process
+serves it from the same path, so both must share that filesystem.
+"""
+
+import logging
+from config import Config
+from core.simple_exporter import export_to_docx, export_to_pdf
+
+logger = logging.getLogger(__name__)
+
+# Optional Celery integration
+try:
+    from celery import Celery
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+    logger.info("Celery library not available - exports run in-process")
+
+
+def build_export(resume_text, format_type, output, mimetype, download_name):
+    """Write the resume export to a path or stream and return what the download needs"""
+    if format_type == "pdf":
+        export_to_pdf(resume_text, output)
+    else:
+        export_to_docx(resume_text, output)
+    
+    return {
+        'filepath': output,
+        'mimetype': mimetype,
+        'download_name': download_name
+    }
+
+
+celery = None
+build_export_task = None
+
+if CELERY_AVAILABLE and Config.CELERY_BROKER_URL:
+    celery = Celery('resume', broker=Config.CELERY_BROKER_URL, backend=Config.CELERY_RESULT_BACKEND)
+    build_export_task = celery.task(name='resume.build_export')(build_export)
+    logger.info("Celery export worker configured")
@@ -0,0 +1,20 @@
+"""
+WSGI entry point for running Resume AI under Gunicorn
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+# Patch blocking IO before anything else is imported so DB sockets and
+# export file writes yield to other requests under gevent workers
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
+from app import app, start_cleanup_scheduler
+
+# Cleanup old files on startup and periodically afterwards; only the
+# worker holding the cleanup lock actually runs it
+start_cleanup_scheduler()